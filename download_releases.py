@@ -19,10 +19,18 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 import time
 
+# orjson is optional - it speeds up reading monitor output and writing results when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from github_version_db import VersionDatabase
+from github_version_sqlite import SQLITE_EXTENSIONS, SQLiteVersionDatabase
 from version_compare import VersionComparator
 from github_downloader import GitHubDownloader
 
@@ -128,10 +136,13 @@ class ReleaseDownloadCoordinator:
                 endpoint_info = f" via {endpoint_url}" if endpoint_url else ""
                 logger.info(f"Using boto3-based S3 version storage: s3://{s3_config.get('bucket')}/{s3_config.get('prefix', 'release-monitor/')}version_db.json{endpoint_info}")
         else:
-            # Use local file storage
-            self.version_db = VersionDatabase(
-                download_config.get('version_db', 'version_db.json')
-            )
+            # Use local file storage; a SQLite path selects the row-per-update backend
+            version_db_path = download_config.get('version_db', 'version_db.json')
+            if version_db_path.lower().endswith(SQLITE_EXTENSIONS):
+                self.version_db = SQLiteVersionDatabase(version_db_path)
+                logger.info(f"Using SQLite version storage: {version_db_path}")
+            else:
+                self.version_db = VersionDatabase(version_db_path)
 
         self.version_comparator = VersionComparator(
             include_prereleases=download_config.get('include_prereleases', False),
@@ -141,7 +152,8 @@ class ReleaseDownloadCoordinator:
         self.downloader = GitHubDownloader(
             token=github_token,
             download_dir=download_config.get('directory', 'downloads'),
-            timeout=download_config.get('timeout', 300)
+            timeout=download_config.get('timeout', 300),
+            max_concurrent_downloads=download_config.get('max_concurrent_downloads', 8)
         )
 
         # Download settings
@@ -191,9 +203,12 @@ class ReleaseDownloadCoordinator:
 
         logger.info(f"Processing {len(monitor_output['releases'])} releases from monitor")
 
+        # Stored version per repository, read from the version database once per run
+        current_versions = {}
+
         for release in monitor_output['releases']:
             try:
-                result = self._process_single_release(release)
+                result = self._process_single_release(release, current_versions)
                 results['download_results'].append(result)
                 results['total_releases_checked'] += 1
 
@@ -226,12 +241,15 @@ class ReleaseDownloadCoordinator:
 
         return results
 
-    def _process_single_release(self, release: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_single_release(self, release: Dict[str, Any],
+                                current_versions: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """
         Process a single release for potential download.
 
         Args:
             release: Release data from monitor
+            current_versions: Optional cache of stored versions by repository, shared
+                across the releases of one run and kept current as releases download
 
         Returns:
             Processing result for this release
@@ -239,10 +257,9 @@ class ReleaseDownloadCoordinator:
         repository = release.get('repository', 'unknown')
         tag_name = release.get('tag_name', 'unknown')
 
-        # Parse repository owner/name
-        if '/' in repository:
-            owner, repo = repository.split('/', 1)
-        else:
+        # Parse repository owner/name, which must be exactly two non-empty parts
+        owner, _, repo = repository.partition('/')
+        if not owner or not repo or '/' in repo:
             logger.warning(f"Invalid repository format: {repository}")
             return {
                 'repository': repository,
@@ -251,21 +268,29 @@ class ReleaseDownloadCoordinator:
                 'reason': 'Invalid repository format'
             }
 
-        logger.debug(f"Processing {repository}:{tag_name}")
+        # Debug messages in this per-release path use lazy %-style arguments, so they
+        # are only formatted when debug logging is on
+        logger.debug("Processing %s:%s", repository, tag_name)
 
         # Get current stored version
-        current_version = self.version_db.get_current_version(owner, repo)
+        if current_versions is not None and repository in current_versions:
+            current_version = current_versions[repository]
+        else:
+            current_version = self.version_db.get_current_version(owner, repo)
+            if current_versions is not None:
+                current_versions[repository] = current_version
 
         # Get repository-specific configuration to check for target version
         repo_override = self.repository_overrides.get(repository, {})
         target_version = repo_override.get('target_version')
-        logger.debug(f"Repository {repository}: override config = {repo_override}, target_version = {target_version}")
+        logger.debug("Repository %s: override config = %s, target_version = %s",
+                     repository, repo_override, target_version)
 
         if target_version:
             # Target version specified - check if this release matches the target
             if tag_name != target_version:
                 reason = f"Release {tag_name} does not match target version {target_version}"
-                logger.debug(f"Skipping {repository}: {reason}")
+                logger.debug("Skipping %s: %s", repository, reason)
                 return {
                     'repository': repository,
                     'tag_name': tag_name,
@@ -280,7 +305,7 @@ class ReleaseDownloadCoordinator:
             github_prerelease = release.get('prerelease')  # Get GitHub's official prerelease flag
             if not self.version_comparator.is_newer(tag_name, current_version, github_prerelease):
                 reason = f"Version {tag_name} is not newer than {current_version}"
-                logger.debug(f"Skipping {repository}: {reason}")
+                logger.debug("Skipping %s: %s", repository, reason)
                 return {
                     'repository': repository,
                     'tag_name': tag_name,
@@ -294,7 +319,7 @@ class ReleaseDownloadCoordinator:
         has_source = bool(release.get('tarball_url') or release.get('zipball_url'))
 
         if not has_assets and not has_source:
-            logger.debug(f"No downloadable content found for {repository}:{tag_name}")
+            logger.debug("No downloadable content found for %s:%s", repository, tag_name)
             return {
                 'repository': repository,
                 'tag_name': tag_name,
@@ -326,6 +351,8 @@ class ReleaseDownloadCoordinator:
                 }
 
                 self.version_db.update_version(owner, repo, tag_name, download_metadata)
+                if current_versions is not None:
+                    current_versions[repository] = tag_name
 
                 logger.info(f"Successfully downloaded {len(successful_downloads)} assets "
                            f"for {repository}:{tag_name}")
@@ -419,12 +446,23 @@ def load_monitor_output(input_source: str) -> Dict[str, Any]:
             data = f.read()
 
     try:
-        return json.loads(data)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON input: {e}")
         sys.exit(1)
 
 
+def dump_json(data: Any) -> str:
+    """Encode a report as indented JSON, rendering values JSON can't hold with str()."""
+    if ORJSON_AVAILABLE:
+        # Pass datetimes to default too and accept non-str keys, so output matches the stdlib fallback
+        return orjson.dumps(data, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                            | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, default=str)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -490,7 +528,7 @@ def main():
     # Handle status request
     if args.status:
         status = coordinator.get_status_report()
-        output = json.dumps(status, indent=2)
+        output = dump_json(status)
 
         if args.output:
             with open(args.output, 'w') as f:
@@ -516,7 +554,7 @@ def main():
         results = coordinator.process_monitor_output(monitor_output)
 
     # Output results
-    output = json.dumps(results, indent=2, default=str)
+    output = dump_json(results)
 
     if args.output:
         with open(args.output, 'w') as f:
@@ -7,19 +7,106 @@ retry logic, and proper error handling.
 """
 
 import os
+import re
+import fnmatch
+import functools
 import hashlib
+import hmac
 import time
 import logging
 import requests
-from typing import Dict, List, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import tempfile
 import shutil
 from urllib.parse import urlparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses (rate limiting, gateway errors) the session retries itself,
+# waiting as long as a Retry-After header asks (up to MAX_RETRY_AFTER seconds) and
+# backing off exponentially otherwise
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RETRY_AFTER = 60
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than MAX_RETRY_AFTER seconds."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+STATUS_RETRY = CappedRetry(total=None, connect=0, read=0, status=3, backoff_factor=0.5,
+                           status_forcelist=RETRY_STATUSES, respect_retry_after_header=True,
+                           raise_on_status=False)
+
+
+# Characters that make a glob pattern more than literal text
+GLOB_WILDCARDS = frozenset('*?[')
+
+
+def _compile_globs(globs: List[str]) -> Optional[Callable[[str], bool]]:
+    """
+    Build a case-insensitive predicate matching a name against any of the globs.
+
+    Suffix-only ('*.zip') and literal patterns are checked with str.endswith and
+    set membership; any other pattern makes the whole list one regex union.
+    """
+    if not globs:
+        return None
+
+    lowered = [glob.lower() for glob in globs]
+    if all(glob.startswith('*') and GLOB_WILDCARDS.isdisjoint(glob[1:]) for glob in lowered):
+        suffixes = tuple(glob[1:] for glob in lowered)
+        return lambda name: name.lower().endswith(suffixes)
+    if all(GLOB_WILDCARDS.isdisjoint(glob) for glob in lowered):
+        literals = frozenset(lowered)
+        return lambda name: name.lower() in literals
+
+    regex = re.compile('|'.join(fnmatch.translate(glob) for glob in globs), re.IGNORECASE)
+    return lambda name: regex.match(name) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern_set(patterns: Tuple[str, ...]) -> Tuple[Optional[Callable[[str], bool]],
+                                                             Optional[Callable[[str], bool]]]:
+    """
+    Combine a pattern list into one inclusion and one exclusion ('!'-prefixed) matcher.
+
+    Either matcher is None when the list has no patterns of that kind.
+    """
+    include = _compile_globs([p for p in patterns if not p.startswith('!')])
+    exclude = _compile_globs([p[1:] for p in patterns if p.startswith('!')])
+    return include, exclude
+
+
+def _subdirectories(path) -> List[os.DirEntry]:
+    """List the directories directly inside path (following symlinks, like Path.is_dir)."""
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+def _repository_usage(repo_dir: os.DirEntry) -> Tuple[int, int]:
+    """Count the downloaded files (checksum files aside) and bytes of one repository."""
+    files = 0
+    size = 0
+    # scandir entries carry the file type from the directory listing, saving a stat per entry
+    for tag_dir in _subdirectories(repo_dir.path):
+        with os.scandir(tag_dir.path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith('.sha256'):
+                    files += 1
+                    size += entry.stat().st_size
+    return files, size
+
 
 class GitHubDownloader:
     """
@@ -27,7 +114,8 @@ class GitHubDownloader:
     """
 
     def __init__(self, token: Optional[str] = None, download_dir: str = 'downloads',
-                 chunk_size: int = 8192, timeout: int = 300):
+                 chunk_size: int = 1024 * 1024, timeout: int = 300,
+                 max_concurrent_downloads: int = 8):
         """
         Initialize GitHub downloader.
 
@@ -36,17 +124,28 @@ class GitHubDownloader:
             download_dir: Directory to store downloaded files
             chunk_size: Chunk size for streaming downloads (bytes)
             timeout: Request timeout in seconds
+            max_concurrent_downloads: Maximum number of assets of a release downloaded at once
         """
         self.token = token
         self.download_dir = Path(download_dir)
         self.chunk_size = chunk_size
         self.timeout = timeout
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
 
         # Create download directory
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
         # Setup session with optional authentication
         self.session = requests.Session()
+
+        # Keep one pooled keep-alive connection per concurrent download, so parallel
+        # downloads from the same host reuse connections instead of discarding them.
+        # Transient error statuses are retried here; _download_with_retry retries the rest
+        adapter = HTTPAdapter(pool_maxsize=max(self.max_concurrent_downloads, 10),
+                              max_retries=STATUS_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         headers = {
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'GitHub-Release-Monitor-Downloader/1.0'
@@ -133,27 +232,35 @@ class GitHubDownloader:
         release_dir = self.download_dir / repo_name / tag_name
         release_dir.mkdir(parents=True, exist_ok=True)
 
-        download_results = []
-
-        for asset in release_data.get('assets', []):
+        def download(asset):
             try:
-                # Check if asset matches patterns
-                if asset_patterns and not self._matches_patterns(asset['name'], asset_patterns):
-                    logger.debug(f"Skipping asset {asset['name']} (doesn't match patterns)")
-                    continue
-
                 # Download the asset
-                result = self._download_single_asset(asset, release_dir, release_data)
-                download_results.append(result)
+                return self._download_single_asset(asset, release_dir, release_data)
 
             except Exception as e:
                 logger.error(f"Failed to download asset {asset.get('name', 'unknown')}: {e}")
-                download_results.append({
+                return {
                     'asset_name': asset.get('name', 'unknown'),
                     'success': False,
                     'error': str(e),
                     'download_time': time.time()
-                })
+                }
+
+        # Filter by name in one pass first, so skipped assets never take a worker
+        assets = release_data.get('assets', [])
+        if asset_patterns:
+            matching_assets = self.filter_assets(assets, asset_patterns)
+            if len(matching_assets) < len(assets):
+                logger.debug(f"Skipping {len(assets) - len(matching_assets)} assets (don't match patterns)")
+            assets = matching_assets
+
+        # Overlap the network round trips of multi-asset releases; results keep asset order
+        max_workers = min(self.max_concurrent_downloads, len(assets))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                download_results = list(executor.map(download, assets))
+        else:
+            download_results = [download(asset) for asset in assets]
 
         logger.info(f"Downloaded {sum(1 for r in download_results if r['success'])} of "
                    f"{len(download_results)} assets for {repo_name}:{tag_name}")
@@ -183,11 +290,11 @@ class GitHubDownloader:
 
         try:
             # Download with retry logic
-            success, error_msg = self._download_with_retry(download_url, file_path, asset)
+            success, error_msg, verification_result = self._download_with_retry(download_url, file_path, asset)
 
             if success:
-                # Verify download
-                verification_result = self.verify_download(file_path)
+                if verification_result is None:
+                    verification_result = self.verify_download(file_path)
 
                 # Prepare result metadata
                 result = {
@@ -227,11 +334,40 @@ class GitHubDownloader:
                 'download_time': time.time() - start_time
             }
 
+    def _verify_existing_download(self, file_path: Path, content_length: int) -> Optional[Dict[str, Any]]:
+        """
+        Check whether a previous download of the same size is already in place.
+
+        Args:
+            file_path: Local file path of the asset
+            content_length: Size reported by the server
+
+        Returns:
+            Verification result if the file has the expected size and still matches
+            its checksum file, otherwise None
+        """
+        checksum_file = file_path.with_suffix(file_path.suffix + '.sha256')
+        try:
+            if not checksum_file.exists() or file_path.stat().st_size != content_length:
+                return None
+        except FileNotFoundError:
+            return None
+
+        # A file of the right size may still be corrupt or tampered with
+        verification = self.verify_download(file_path)
+        if verification.get('checksum_match'):
+            return verification
+        logger.warning(f"{file_path.name} doesn't match its checksum file, downloading it again")
+        return None
+
     def _download_with_retry(self, url: str, file_path: Path, asset: Dict[str, Any],
-                           max_retries: int = 3) -> Tuple[bool, Optional[str]]:
+                           max_retries: int = 3) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
         """
         Download file with retry logic and streaming.
 
+        Error statuses are not retried here; the session's adapter already retried
+        the transient ones.
+
         Args:
             url: Download URL
             file_path: Local file path to save to
@@ -239,7 +375,9 @@ class GitHubDownloader:
             max_retries: Maximum number of retry attempts
 
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (success, error_message, verification); verification describes the
+            file in place, checked against the asset's published digest when GitHub
+            provides one, and is None on failure
         """
         last_error = None
 
@@ -262,29 +400,54 @@ class GitHubDownloader:
                             logger.warning(f"Content-Length ({content_length}) doesn't match "
                                          f"expected size ({expected_size})")
 
+                    # Skip the transfer when an earlier complete download (it has a checksum file) matches
+                    existing = self._verify_existing_download(file_path, content_length) if content_length else None
+                    if existing:
+                        logger.info(f"{file_path.name} already downloaded ({content_length} bytes), skipping")
+                        response.close()
+                        temp_file.close()
+                        temp_path.unlink()
+                        return True, None, existing
+
                     # Download in chunks with progress reporting
                     downloaded_size = 0
                     hash_sha256 = hashlib.sha256()
                     last_progress_time = time.time()
 
+                    # Reserve the asset's full size up front so the file is laid out contiguously;
+                    # only when the size is known, since a short download must fail the size check
+                    preallocated = False
+                    if expected_size and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(temp_file.fileno(), 0, expected_size)
+                            preallocated = True
+                        except OSError:
+                            pass  # Not supported by this filesystem; write as usual
+
+                    # iter_content decodes gzip/deflate and wraps stream errors in requests exceptions
                     for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if chunk:  # Filter out keep-alive chunks
-                            temp_file.write(chunk)
-                            hash_sha256.update(chunk)
-                            downloaded_size += len(chunk)
-
-                            # Report progress every 5 seconds
-                            current_time = time.time()
-                            if current_time - last_progress_time >= 5:
-                                mb_downloaded = downloaded_size / (1024 * 1024)
-                                if content_length:
-                                    percent = (downloaded_size / content_length) * 100
-                                    mb_total = content_length / (1024 * 1024)
-                                    logger.info(f"Download progress: {mb_downloaded:.1f}/{mb_total:.1f} MB ({percent:.1f}%)")
-                                else:
-                                    logger.info(f"Download progress: {mb_downloaded:.1f} MB downloaded")
-                                last_progress_time = current_time
-
+                        if not chunk:  # Skip keep-alive and empty decoder chunks
+                            continue
+
+                        temp_file.write(chunk)
+                        hash_sha256.update(chunk)
+                        downloaded_size += len(chunk)
+
+                        # Report progress every 5 seconds
+                        current_time = time.time()
+                        if current_time - last_progress_time >= 5:
+                            mb_downloaded = downloaded_size / (1024 * 1024)
+                            if content_length:
+                                percent = (downloaded_size / content_length) * 100
+                                mb_total = content_length / (1024 * 1024)
+                                logger.info(f"Download progress: {mb_downloaded:.1f}/{mb_total:.1f} MB ({percent:.1f}%)")
+                            else:
+                                logger.info(f"Download progress: {mb_downloaded:.1f} MB downloaded")
+                            last_progress_time = current_time
+
+                    if preallocated:
+                        # Drop any reserved space a short download left unwritten
+                        temp_file.truncate(downloaded_size)
                     temp_file.flush()
                     os.fsync(temp_file.fileno())
 
@@ -294,15 +457,32 @@ class GitHubDownloader:
                     raise ValueError(f"Downloaded size ({downloaded_size}) doesn't match "
                                    f"expected size ({expected_size})")
 
-                # Atomically move to final location
-                shutil.move(str(temp_path), str(file_path))
+                # Check the checksum computed while streaming against the one GitHub publishes
+                calculated_checksum = hash_sha256.hexdigest()
+                expected_checksum = self._published_checksum(asset)
+                if expected_checksum and not hmac.compare_digest(calculated_checksum.encode(), expected_checksum.encode()):
+                    temp_path.unlink()
+                    raise ValueError(f"Downloaded checksum ({calculated_checksum}) doesn't match "
+                                   f"published checksum ({expected_checksum})")
+
+                # Atomically move to final location; the temp file shares its directory,
+                # so this is a rename and never a copy
+                os.replace(temp_path, file_path)
 
                 # Store checksum for verification
                 checksum_file = file_path.with_suffix(file_path.suffix + '.sha256')
                 with open(checksum_file, 'w') as f:
-                    f.write(f"{hash_sha256.hexdigest()}  {file_path.name}\n")
+                    f.write(f"{calculated_checksum}  {file_path.name}\n")
 
-                return True, None
+                # Without a published digest there is nothing independent to compare against
+                return True, None, {
+                    'verified': True,
+                    'file_path': str(file_path),
+                    'file_size': downloaded_size,
+                    'sha256': calculated_checksum,
+                    'checksum_match': True if expected_checksum else None,
+                    'expected_checksum': expected_checksum
+                }
 
             except Exception as e:
                 last_error = str(e)
@@ -320,13 +500,51 @@ class GitHubDownloader:
                 except:
                     pass
 
+                # The session already retried transient error statuses, so an error status is final
+                if isinstance(e, requests.HTTPError):
+                    break
+
                 if attempt < max_retries:
                     # Exponential backoff
                     delay = 2 ** attempt
                     logger.info(f"Retrying in {delay} seconds...")
                     time.sleep(delay)
 
-        return False, f"Failed after {max_retries + 1} attempts. Last error: {last_error}"
+        return False, f"Failed after {attempt + 1} attempts. Last error: {last_error}", None
+
+    def _published_checksum(self, asset: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the SHA256 checksum GitHub publishes for a release asset.
+
+        Args:
+            asset: Asset metadata from GitHub API
+
+        Returns:
+            The lowercase hex checksum from the asset's "sha256:<hex>" digest, or None
+        """
+        algorithm, _, checksum = (asset.get('digest') or '').partition(':')
+        if algorithm != 'sha256' or not checksum:
+            return None
+        return checksum.lower()
+
+    def _stored_checksum(self, file_path: Path) -> Optional[str]:
+        """
+        Read the SHA256 checksum recorded next to a downloaded file.
+
+        Args:
+            file_path: Path to downloaded file
+
+        Returns:
+            The stored checksum, or None if there is no checksum file
+        """
+        checksum_file = file_path.with_suffix(file_path.suffix + '.sha256')
+        try:
+            with open(checksum_file, 'r') as f:
+                # Lines read "<checksum>  <file name>", as written by sha256sum
+                fields = f.readline().split(maxsplit=1)
+        except FileNotFoundError:
+            return None
+        return fields[0] if fields else None
 
     def verify_download(self, file_path: Path, expected_checksum: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -348,27 +566,27 @@ class GitHubDownloader:
 
         try:
             # Calculate SHA256 checksum
-            hash_sha256 = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(self.chunk_size), b""):
-                    hash_sha256.update(chunk)
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: hash in C with the GIL released, no per-chunk Python loop
+                    hash_sha256 = hashlib.file_digest(f, 'sha256')
+                else:
+                    hash_sha256 = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                        hash_sha256.update(chunk)
 
             calculated_checksum = hash_sha256.hexdigest()
 
             # Check if we have a stored checksum file
-            checksum_file = file_path.with_suffix(file_path.suffix + '.sha256')
-            stored_checksum = None
-            if checksum_file.exists():
-                with open(checksum_file, 'r') as f:
-                    line = f.readline().strip()
-                    if line:
-                        stored_checksum = line.split()[0]
+            stored_checksum = self._stored_checksum(file_path)
 
             # Verify against expected or stored checksum
             checksum_to_verify = expected_checksum or stored_checksum
             checksum_match = None
             if checksum_to_verify:
-                checksum_match = calculated_checksum.lower() == checksum_to_verify.lower()
+                # Hex digests are lowercase; compare as bytes so any expected value is accepted
+                checksum_match = hmac.compare_digest(calculated_checksum.encode(),
+                                                     checksum_to_verify.lower().encode())
 
             result = {
                 'verified': True,
@@ -404,29 +622,35 @@ class GitHubDownloader:
         Returns:
             True if filename matches any pattern
         """
-        import fnmatch
+        include, exclude = _compile_pattern_set(tuple(patterns))
 
-        filename_lower = filename.lower()
-        matched = False
+        # A filename must match an inclusion pattern and no exclusion pattern.
+        # Exclusions are narrow, so checking them first rejects names early.
+        if include is None or (exclude is not None and exclude(filename)):
+            return False
+        return include(filename)
 
-        # First check inclusion patterns
-        for pattern in patterns:
-            if not pattern.startswith('!'):
-                if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                    matched = True
-                    break
+    def filter_assets(self, assets: List[Dict[str, Any]], patterns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Select the assets whose names match the given patterns.
 
-        # If no inclusion pattern matched, return False
-        if not matched:
-            return False
+        Args:
+            assets: Asset metadata from GitHub API
+            patterns: List of patterns (supports * wildcards and '!' exclusions)
 
-        # Now check exclusion patterns
-        for pattern in patterns:
-            if pattern.startswith('!'):
-                if fnmatch.fnmatch(filename_lower, pattern[1:].lower()):
-                    return False
+        Returns:
+            Matching assets in their original order
+        """
+        include, exclude = _compile_pattern_set(tuple(patterns))
+        if include is None:
+            return []
 
-        return True
+        # Match every name against the compiled patterns in one pass, exclusions first
+        return [
+            asset for asset in assets
+            if (exclude is None or not exclude(asset.get('name', '')))
+            and include(asset.get('name', ''))
+        ]
 
     def get_download_stats(self) -> Dict[str, Any]:
         """
@@ -442,25 +666,24 @@ class GitHubDownloader:
                 'repositories': 0
             }
 
-        total_files = 0
-        total_size = 0
-        repositories = set()
+        repo_dirs = _subdirectories(self.download_dir)
 
-        for repo_dir in self.download_dir.iterdir():
-            if repo_dir.is_dir():
-                repositories.add(repo_dir.name)
-                for tag_dir in repo_dir.iterdir():
-                    if tag_dir.is_dir():
-                        for file_path in tag_dir.iterdir():
-                            if file_path.is_file() and not file_path.name.endswith('.sha256'):
-                                total_files += 1
-                                total_size += file_path.stat().st_size
+        # Scan repositories in parallel so their directory listings and stats overlap
+        max_workers = min(os.cpu_count() or 1, len(repo_dirs))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                usage = list(executor.map(_repository_usage, repo_dirs))
+        else:
+            usage = [_repository_usage(repo_dir) for repo_dir in repo_dirs]
+
+        total_files = sum(files for files, _ in usage)
+        total_size = sum(size for _, size in usage)
 
         return {
             'total_files': total_files,
             'total_size': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'repositories': len(repositories),
+            'repositories': len(repo_dirs),
             'download_dir': str(self.download_dir)
         }
 
@@ -480,21 +703,20 @@ class GitHubDownloader:
         cleaned_files = 0
         freed_space = 0
 
-        for repo_dir in self.download_dir.iterdir():
-            if not repo_dir.is_dir():
-                continue
-
+        for repo_dir in _subdirectories(self.download_dir):
             # Get all version directories sorted by modification time
-            version_dirs = [d for d in repo_dir.iterdir() if d.is_dir()]
+            version_dirs = _subdirectories(repo_dir.path)
             version_dirs.sort(key=lambda d: d.stat().st_mtime, reverse=True)
 
             # Remove old versions
-            for old_dir in version_dirs[keep_versions:]:
+            for old_entry in version_dirs[keep_versions:]:
+                old_dir = old_entry.path
                 try:
-                    for file_path in old_dir.iterdir():
-                        if file_path.is_file():
-                            freed_space += file_path.stat().st_size
-                            cleaned_files += 1
+                    with os.scandir(old_dir) as entries:
+                        for entry in entries:
+                            if entry.is_file():
+                                freed_space += entry.stat().st_size
+                                cleaned_files += 1
 
                     shutil.rmtree(old_dir)
                     logger.info(f"Cleaned up old version: {old_dir}")
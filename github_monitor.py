@@ -41,6 +41,8 @@ class GitHubMonitor:
         self.token = token
         self.rate_limit_delay = rate_limit_delay
         self.session = requests.Session()
+        # ETag of the last /releases/latest response per "owner/repo", sent as If-None-Match
+        self.etags: Dict[str, str] = {}
 
         headers = {
             "Accept": "application/vnd.github.v3+json",
@@ -86,15 +88,23 @@ class GitHubMonitor:
             repo: Repository name
 
         Returns:
-            Latest release information or None if no releases
+            Latest release information, or None if there are no releases or the
+            release is unchanged since the ETag stored in self.etags
         """
         url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+        repo_key = f"{owner}/{repo}"
+
+        # Conditional request: GitHub answers 304 without a body (or a rate limit hit)
+        # when the latest release hasn't changed
+        request_kwargs = {}
+        if repo_key in self.etags:
+            request_kwargs["headers"] = {"If-None-Match": self.etags[repo_key]}
 
         try:
             # Add rate limiting delay
             time.sleep(self.rate_limit_delay)
 
-            response = self.session.get(url)
+            response = self.session.get(url, **request_kwargs)
 
             # Handle rate limiting
             if response.status_code == 403 and "rate limit" in response.text.lower():
@@ -102,13 +112,22 @@ class GitHubMonitor:
                 wait_time = max(0, reset_time - int(time.time())) + 60
                 logger.warning(f"Rate limit hit. Waiting {wait_time} seconds...")
                 time.sleep(wait_time)
-                response = self.session.get(url)
+                response = self.session.get(url, **request_kwargs)
+
+            if response.status_code == 304:
+                logger.info(f"Latest release for {repo_key} unchanged since last check")
+                return None
 
             if response.status_code == 404:
                 logger.warning(f"No releases found for {owner}/{repo}")
                 return None
 
             response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            if etag:
+                self.etags[repo_key] = etag
+
             return response.json()
 
         except requests.exceptions.RequestException as e:
@@ -203,6 +222,18 @@ class ReleaseTracker:
         self.state["last_run"] = datetime.now(timezone.utc).isoformat()
         self._save_state()
 
+    def get_etag(self, repo_key: str) -> Optional[str]:
+        """Get ETag of the last latest-release response for repository"""
+        return self.state["repositories"].get(repo_key, {}).get("etag")
+
+    def set_etag(self, repo_key: str, etag: Optional[str]):
+        """Set ETag for repository (saved with the next last checked update)"""
+        repo_state = self.state["repositories"].setdefault(repo_key, {})
+        if etag:
+            repo_state["etag"] = etag
+        else:
+            repo_state.pop("etag", None)
+
     def has_new_release(self, repo_key: str, release_date: datetime) -> bool:
         """Check if release is newer than last checked timestamp"""
         last_checked = self.get_last_checked(repo_key)
@@ -366,8 +397,13 @@ def find_newest_clean_release(releases: List[Dict[str, Any]], strict_filtering:
         return None
 
 
-def main():
-    """Main function"""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main function
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description="Monitor GitHub repositories for new releases"
     )
@@ -399,7 +435,7 @@ def main():
         help="Force local storage for downloads, bypassing S3/Artifactory auto-detection from environment variables",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Get GitHub token from environment (optional)
     github_token = os.getenv("GITHUB_TOKEN")
@@ -488,7 +524,11 @@ def main():
                         logger.info(f"No clean releases found for {repo_key} with strict filtering")
                         continue
                 else:
-                    # Use the standard latest release endpoint
+                    # Use the standard latest release endpoint, skipping unchanged
+                    # releases via their ETag unless every release must be reported
+                    etag = None if args.force_check else tracker.get_etag(repo_key)
+                    if etag:
+                        monitor.etags[repo_key] = etag
                     latest_release = monitor.get_latest_release(owner, repo)
                     if not latest_release:
                         continue
@@ -532,7 +572,8 @@ def main():
             new_releases.append(release_info)
             logger.info(f"New release found: {repo_key} {latest_release['tag_name']}")
 
-        # Update last checked timestamp
+        # Update last checked timestamp (and the ETag for the next conditional request)
+        tracker.set_etag(repo_key, monitor.etags.get(repo_key))
         tracker.update_last_checked(repo_key, datetime.now(timezone.utc))
 
     # Prepare output
@@ -589,5 +630,24 @@ def main():
     logger.info(f"Monitoring complete. Found {len(new_releases)} new releases.")
 
 
+def run(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the monitor in-process and return its exit status instead of exiting
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit status (0 on success)
+    """
+    try:
+        main(argv)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
 if __name__ == "__main__":
     main()
@@ -6,17 +6,28 @@ Manages a persistent database of repository versions and download history.
 Supports tracking current versions, download metadata, and audit trail.
 """
 
+import copy
 import json
 import os
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import fcntl
 import tempfile
 import shutil
 
+# orjson is optional - it speeds up database reads and writes when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# db_path that keeps the database in memory instead of a file (like sqlite3's ":memory:")
+MEMORY_DB_PATH = ':memory:'
+
 
 class VersionDatabase:
     """
@@ -30,14 +41,19 @@ class VersionDatabase:
         Initialize version database.
 
         Args:
-            db_path: Path to the JSON database file
+            db_path: Path to the JSON database file, or ':memory:' for a database
+                that lives only as long as this object
         """
         self.db_path = db_path
+        self._memory: Optional[Dict[str, Any]] = {} if db_path == MEMORY_DB_PATH else None
+        # Parsed content for read-only lookups, keyed by the file's stat signature
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_signature: Optional[Tuple[int, int, int]] = None
         self._ensure_db_exists()
 
     def _ensure_db_exists(self):
         """Create database file if it doesn't exist."""
-        if not os.path.exists(self.db_path):
+        if self._memory is not None or not os.path.exists(self.db_path):
             self._write_db({
                 'metadata': {
                     'created_at': datetime.now(timezone.utc).isoformat(),
@@ -55,12 +71,17 @@ class VersionDatabase:
         Returns:
             Database content as dictionary
         """
+        if self._memory is not None:
+            # Hand out a copy so updates only take effect through _write_db()
+            return copy.deepcopy(self._memory)
+
         try:
-            with open(self.db_path, 'r') as f:
+            with open(self.db_path, 'rb') as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)  # Shared lock for reading
-                data = json.load(f)
+                content = f.read()
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)  # Unlock
-                return data
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Error reading database: {e}")
             # Return empty structure if file is corrupted
@@ -72,6 +93,54 @@ class VersionDatabase:
                 'repositories': {}
             }
 
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Identify the database file contents by inode, modification time and size."""
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def reload(self) -> bool:
+        """
+        Re-read the database if the file changed since it was last read.
+
+        Returns:
+            True if the file was re-read, False if the cached content is current
+        """
+        if self._memory is not None:
+            changed = self._cache is not self._memory
+            self._cache = self._memory
+            return changed
+
+        signature = self._file_signature()
+        if signature is not None and signature == self._cache_signature:
+            return False
+
+        self._cache = self._read_db()
+        self._cache_signature = signature
+        return True
+
+    def _read_db_cached(self) -> Dict[str, Any]:
+        """
+        Read database for lookups, re-parsing only when the file changed.
+
+        The returned dictionary is shared between calls and must not be modified:
+        public getters copy anything mutable they return, and updates go through
+        _read_db() so they always start from the file on disk.
+
+        Returns:
+            Database content as dictionary
+        """
+        self.reload()
+        return self._cache
+
+    def _serialize(self, data: Dict[str, Any]) -> bytes:
+        """Encode database content as indented UTF-8 JSON."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
     def _write_db(self, data: Dict[str, Any]):
         """
         Write database with atomic operations and file locking.
@@ -82,12 +151,21 @@ class VersionDatabase:
         # Update metadata
         data['metadata']['last_updated'] = datetime.now(timezone.utc).isoformat()
 
+        # Don't rely on the file signature alone to notice this write: mtime
+        # granularity can leave it unchanged when writes follow each other quickly
+        self._cache = None
+        self._cache_signature = None
+
+        if self._memory is not None:
+            self._memory = data
+            return
+
         # Atomic write using temporary file
         dir_path = os.path.dirname(self.db_path) or '.'
-        with tempfile.NamedTemporaryFile(mode='w', dir=dir_path, delete=False) as temp_f:
+        with tempfile.NamedTemporaryFile(mode='wb', dir=dir_path, delete=False) as temp_f:
             try:
                 fcntl.flock(temp_f.fileno(), fcntl.LOCK_EX)  # Exclusive lock
-                json.dump(data, temp_f, indent=2, ensure_ascii=False)
+                temp_f.write(self._serialize(data))
                 temp_f.flush()
                 os.fsync(temp_f.fileno())  # Force write to disk
                 fcntl.flock(temp_f.fileno(), fcntl.LOCK_UN)  # Unlock
@@ -119,7 +197,7 @@ class VersionDatabase:
         Returns:
             Current version string or None if not found
         """
-        data = self._read_db()
+        data = self._read_db_cached()
         repo_key = self._get_repo_key(owner, repo)
 
         repo_data = data['repositories'].get(repo_key)
@@ -186,7 +264,7 @@ class VersionDatabase:
         Returns:
             List of download history entries (most recent first)
         """
-        data = self._read_db()
+        data = self._read_db_cached()
         repo_key = self._get_repo_key(owner, repo)
 
         repo_data = data['repositories'].get(repo_key)
@@ -194,8 +272,8 @@ class VersionDatabase:
             return []
 
         history = repo_data.get('download_history', [])
-        # Return most recent entries first
-        return list(reversed(history[-limit:]))
+        # Return most recent entries first, copied so callers can't change the cached database
+        return copy.deepcopy(list(reversed(history[-limit:])))
 
     def get_all_repositories(self) -> List[Dict[str, Any]]:
         """
@@ -204,7 +282,7 @@ class VersionDatabase:
         Returns:
             List of repository summaries with current versions
         """
-        data = self._read_db()
+        data = self._read_db_cached()
         repositories = []
 
         for repo_key, repo_data in data['repositories'].items():
@@ -247,7 +325,7 @@ class VersionDatabase:
         Returns:
             Statistics about the database content
         """
-        data = self._read_db()
+        data = self._read_db_cached()
 
         total_repos = len(data['repositories'])
         total_downloads = sum(
@@ -484,7 +484,8 @@ class S3VersionDatabase:
     """
 
     def __init__(self, bucket: str, key_prefix: str = 'release-monitor/',
-                 region: Optional[str] = None, profile: Optional[str] = None):
+                 region: Optional[str] = None, profile: Optional[str] = None,
+                 use_mc: Optional[bool] = None):
         """
         Initialize S3 version database with automatic implementation selection.
 
@@ -493,9 +494,11 @@ class S3VersionDatabase:
             key_prefix: Prefix for all version keys in S3
             region: AWS region (optional, ignored for mc implementation)
             profile: AWS profile name (optional, ignored for mc implementation)
+            use_mc: Use the mc implementation (optional, defaults to the S3_USE_MC environment variable)
         """
         # Check if we should use mc implementation
-        use_mc = os.environ.get('S3_USE_MC', 'false').lower() == 'true'
+        if use_mc is None:
+            use_mc = os.environ.get('S3_USE_MC', 'false').lower() == 'true'
 
         if use_mc:
             logger.info("Using MinIO client (mc) for S3 operations")
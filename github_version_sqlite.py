@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+GitHub Version Database - SQLite Backend
+
+Stores the same current versions and download history as the JSON-backed
+VersionDatabase in a SQLite file in WAL mode, so an update writes one row
+instead of rewriting the whole database.
+"""
+
+import json
+import os
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# File extensions of version_db paths that select this backend
+SQLITE_EXTENSIONS = ('.sqlite', '.sqlite3', '.db')
+
+# Download history entries kept per repository, as in the JSON database
+MAX_HISTORY_ENTRIES = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS repositories (
+    repo_key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    current_version TEXT,
+    last_updated TEXT
+);
+CREATE TABLE IF NOT EXISTS download_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repo_key TEXT NOT NULL,
+    version TEXT,
+    previous_version TEXT,
+    downloaded_at TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS download_history_repo ON download_history (repo_key, id);
+"""
+
+
+class SQLiteVersionDatabase:
+    """
+    Manages version tracking and download history for GitHub repositories.
+
+    Drop-in replacement for VersionDatabase backed by a SQLite file.
+    """
+
+    def __init__(self, db_path: str = 'version_db.sqlite'):
+        """
+        Initialize SQLite version database.
+
+        Args:
+            db_path: Path to the SQLite database file, or ':memory:'
+        """
+        self.db_path = db_path
+        # Autocommit mode; writes that span statements open their own transaction.
+        # The connection may be shared between threads, one transaction at a time.
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            # WAL lets readers proceed during a write; NORMAL syncs at checkpoints only
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._ensure_db_exists()
+
+    def _ensure_db_exists(self):
+        """Create the schema and metadata if the database is new."""
+        self._conn.executescript(SCHEMA)
+        created = self._conn.execute(
+            "INSERT OR IGNORE INTO metadata (key, value) VALUES "
+            "('created_at', ?), ('version', '1.0'), "
+            "('description', 'GitHub Release Monitor Version Database')",
+            (datetime.now(timezone.utc).isoformat(),)
+        ).rowcount
+        if created:
+            logger.info(f"Created new version database: {self.db_path}")
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements as one write transaction, serialized across threads."""
+        with self._lock:
+            # IMMEDIATE takes the write lock up front so rows read inside can't change under us
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def _fetch(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read-only query outside any other thread's transaction."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _get_repo_key(self, owner: str, repo: str) -> str:
+        """Generate repository key for database storage."""
+        return f"{owner}/{repo}"
+
+    def get_current_version(self, owner: str, repo: str) -> Optional[str]:
+        """
+        Get stored current version for repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            Current version string or None if not found
+        """
+        rows = self._fetch(
+            'SELECT current_version FROM repositories WHERE repo_key = ?',
+            (self._get_repo_key(owner, repo),)
+        )
+        return rows[0]['current_version'] if rows else None
+
+    def update_version(self, owner: str, repo: str, version: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Update version after successful download.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            version: New version string
+            metadata: Optional metadata (download info, file paths, etc.)
+        """
+        repo_key = self._get_repo_key(owner, repo)
+        now = datetime.now(timezone.utc).isoformat()
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT current_version FROM repositories WHERE repo_key = ?', (repo_key,)
+            ).fetchone()
+            previous_version = row['current_version'] if row else None
+
+            conn.execute(
+                'INSERT INTO repositories (repo_key, owner, repo, current_version, last_updated) '
+                'VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (repo_key) DO UPDATE SET '
+                'current_version = excluded.current_version, last_updated = excluded.last_updated',
+                (repo_key, owner, repo, version, now)
+            )
+            conn.execute(
+                'INSERT INTO download_history (repo_key, version, previous_version, downloaded_at, metadata) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (repo_key, version, previous_version, now, json.dumps(metadata or {}))
+            )
+
+            # Keep only the most recent history entries to prevent unbounded growth
+            conn.execute(
+                'DELETE FROM download_history WHERE repo_key = ? AND id NOT IN '
+                '(SELECT id FROM download_history WHERE repo_key = ? ORDER BY id DESC LIMIT ?)',
+                (repo_key, repo_key, MAX_HISTORY_ENTRIES)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_updated', ?)", (now,)
+            )
+
+        logger.info(f"Updated {repo_key}: {previous_version} → {version}")
+
+    def get_download_history(self, owner: str, repo: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get download history for repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            limit: Maximum number of history entries to return
+
+        Returns:
+            List of download history entries (most recent first)
+        """
+        rows = self._fetch(
+            'SELECT version, previous_version, downloaded_at, metadata FROM download_history '
+            'WHERE repo_key = ? ORDER BY id DESC LIMIT ?',
+            (self._get_repo_key(owner, repo), limit)
+        )
+
+        return [
+            {
+                'version': row['version'],
+                'previous_version': row['previous_version'],
+                'downloaded_at': row['downloaded_at'],
+                'metadata': json.loads(row['metadata'])
+            }
+            for row in rows
+        ]
+
+    def get_all_repositories(self) -> List[Dict[str, Any]]:
+        """
+        Get summary of all tracked repositories.
+
+        Returns:
+            List of repository summaries with current versions
+        """
+        rows = self._fetch(
+            'SELECT r.owner, r.repo, r.current_version, r.last_updated, '
+            '(SELECT COUNT(*) FROM download_history h WHERE h.repo_key = r.repo_key) AS download_count '
+            'FROM repositories r ORDER BY r.rowid'
+        )
+
+        return [dict(row) for row in rows]
+
+    def remove_repository(self, owner: str, repo: str) -> bool:
+        """
+        Remove repository from database.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            True if repository was removed, False if not found
+        """
+        repo_key = self._get_repo_key(owner, repo)
+
+        with self._transaction() as conn:
+            removed = conn.execute('DELETE FROM repositories WHERE repo_key = ?', (repo_key,)).rowcount
+            conn.execute('DELETE FROM download_history WHERE repo_key = ?', (repo_key,))
+
+        if removed:
+            logger.info(f"Removed {repo_key} from database")
+        return bool(removed)
+
+    def get_database_stats(self) -> Dict[str, Any]:
+        """
+        Get database statistics.
+
+        Returns:
+            Statistics about the database content
+        """
+        metadata = {row['key']: row['value'] for row in self._fetch('SELECT key, value FROM metadata')}
+        total_repos = self._fetch('SELECT COUNT(*) FROM repositories')[0][0]
+        total_downloads = self._fetch('SELECT COUNT(*) FROM download_history')[0][0]
+
+        return {
+            'total_repositories': total_repos,
+            'total_downloads': total_downloads,
+            'database_created': metadata.get('created_at'),
+            'last_updated': metadata.get('last_updated'),
+            'database_version': metadata.get('version'),
+            'database_size_bytes': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+        }
@@ -9,6 +9,7 @@ when --releases-json flag is used.
 
 import os
 import sys
+import fnmatch
 import hashlib
 import requests
 from requests.auth import HTTPBasicAuth
@@ -80,28 +81,17 @@ def should_upload_file(relative_path: Path, target_version: str = None, version_
     # Convert folder name back to repository name
     repository = repo_folder.replace('_', '/')
 
-    # Check asset patterns first
+    # Check asset patterns first, with the downloader's rules: matching ignores case,
+    # and a file must match no exclusion ('!') pattern and at least one inclusion pattern
     if asset_patterns:
-        import fnmatch
         filename_lower = filename.lower()
-        pattern_matches = False
-
-        # First check inclusion patterns
-        for pattern in asset_patterns:
-            if not pattern.startswith('!'):
-                if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                    pattern_matches = True
-                    break
-
-        # If no inclusion pattern matched, return False
-        if not pattern_matches:
+        patterns = [pattern.lower() for pattern in asset_patterns]
+        if any(fnmatch.fnmatchcase(filename_lower, pattern[1:])
+               for pattern in patterns if pattern.startswith('!')):
+            return False
+        if not any(fnmatch.fnmatchcase(filename_lower, pattern)
+                   for pattern in patterns if not pattern.startswith('!')):
             return False
-
-        # Now check exclusion patterns
-        for pattern in asset_patterns:
-            if pattern.startswith('!'):
-                if fnmatch.fnmatch(filename_lower, pattern[1:].lower()):
-                    return False
 
     # Check version constraints
     if target_version:
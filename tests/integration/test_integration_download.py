@@ -3,19 +3,21 @@
 Integration tests for GitHub Monitor with Download functionality
 """
 
+import builtins
 import unittest
 import tempfile
 import os
 import json
+import shutil
 import yaml
 from unittest.mock import patch, Mock
 import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from github_monitor import main as monitor_main
+from github_monitor import main as monitor_main, load_config
 
 
 class TestIntegrationDownload(unittest.TestCase):
@@ -60,7 +62,6 @@ class TestIntegrationDownload(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
@@ -103,7 +104,6 @@ class TestIntegrationDownload(unittest.TestCase):
         ]
 
         # Override sys.argv for the test
-        import sys
         original_argv = sys.argv
         sys.argv = [
             'github_monitor.py',
@@ -170,7 +170,6 @@ class TestIntegrationDownload(unittest.TestCase):
             yaml.dump(config_data, f)
 
         # Override sys.argv for the test
-        import sys
         original_argv = sys.argv
         sys.argv = [
             'github_monitor.py',
@@ -199,7 +198,6 @@ class TestIntegrationDownload(unittest.TestCase):
         mock_get_release.return_value = None
 
         # Override sys.argv for the test
-        import sys
         original_argv = sys.argv
         sys.argv = [
             'github_monitor.py',
@@ -250,7 +248,6 @@ class TestIntegrationDownload(unittest.TestCase):
         mock_get_release.return_value = mock_release
 
         # Override sys.argv for the test
-        import sys
         original_argv = sys.argv
         sys.argv = [
             'github_monitor.py',
@@ -262,7 +259,6 @@ class TestIntegrationDownload(unittest.TestCase):
 
         try:
             # Mock import error for download_releases module specifically
-            import builtins
             original_import = builtins.__import__
 
             def mock_import(name, globals=None, locals=None, fromlist=(), level=0):
@@ -295,7 +291,6 @@ class TestIntegrationDownload(unittest.TestCase):
         """Test normal monitor operation without download flag."""
 
         # Override sys.argv for the test
-        import sys
         original_argv = sys.argv
         sys.argv = [
             'github_monitor.py',
@@ -328,8 +323,6 @@ class TestIntegrationDownload(unittest.TestCase):
 
     def test_download_config_validation(self):
         """Test download configuration validation."""
-        from github_monitor import load_config
-
         # Test valid config
         config = load_config(self.config_file)
         download_config = config.get('download', {})
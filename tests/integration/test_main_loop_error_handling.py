@@ -35,6 +35,12 @@ class TestMainLoopErrorHandling(unittest.TestCase):
             yaml.dump(self.config, f)
             self.config_file = f.name
 
+        # Give every test its own state file, so runs in parallel never share one
+        # and nothing is left in the working directory
+        state_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(state_dir.cleanup)
+        self.state_file = os.path.join(state_dir.name, 'release_state.json')
+
     def tearDown(self):
         """Clean up test environment"""
         if hasattr(self, 'config_file') and os.path.exists(self.config_file):
@@ -80,6 +86,7 @@ with patch.object(github_monitor.GitHubMonitor, 'get_latest_release', mock_get_l
     sys.argv = [
         "github_monitor.py",
         "--config", "{self.config_file}",
+        "--state-file", "{self.state_file}",
         "--force-check"
     ]
     try:
@@ -136,6 +143,7 @@ with patch.object(github_monitor.GitHubMonitor, 'get_latest_release', mock_get_l
     sys.argv = [
         "github_monitor.py",
         "--config", "{self.config_file}",
+        "--state-file", "{self.state_file}",
         "--force-check",
         "--format", "json"
     ]
@@ -188,6 +196,7 @@ with patch.object(github_monitor.GitHubMonitor, 'get_latest_release', mock_get_l
     sys.argv = [
         "github_monitor.py",
         "--config", "{self.config_file}",
+        "--state-file", "{self.state_file}",
         "--force-check"
     ]
     try:
@@ -116,7 +116,7 @@ class TestManifestDownloadIntegration(unittest.TestCase):
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(f"Mock content for {asset.get('name', 'unknown')}")
 
-            return True, None
+            return True, None, None
 
         # Patch both the download method and session creation
         with patch('requests.Session') as mock_session_class:
@@ -184,7 +184,7 @@ class TestManifestDownloadIntegration(unittest.TestCase):
             downloaded_files.append(asset.get('name', Path(file_path).name))
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text("mock")
-            return True, None
+            return True, None, None
 
         with patch.object(GitHubDownloader, '_download_with_retry', track_downloads):
             coordinator = ReleaseDownloadCoordinator(config, 'fake_token')
@@ -221,7 +221,7 @@ class TestManifestDownloadIntegration(unittest.TestCase):
             downloaded_files.append(Path(file_path).name)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text("mock")
-            return True, None
+            return True, None, None
 
         with patch.object(GitHubDownloader, '_download_with_retry', track_downloads):
             coordinator = ReleaseDownloadCoordinator(config, 'fake_token')
@@ -239,14 +239,14 @@ class TestManifestDownloadIntegration(unittest.TestCase):
 
         # First download
         with patch.object(GitHubDownloader, '_download_with_retry',
-                         lambda self, url, fp, asset, max_retries=3: (fp.parent.mkdir(parents=True, exist_ok=True) or fp.write_text("mock") or True, None)):
+                         lambda self, url, fp, asset, max_retries=3: (fp.parent.mkdir(parents=True, exist_ok=True) or fp.write_text("mock") or True, None, None)):
             coordinator = ReleaseDownloadCoordinator(config, 'fake_token')
             results1 = coordinator.process_monitor_output(monitor_output)
             self.assertEqual(results1['new_downloads'], 1)
 
         # Second attempt - should skip
         with patch.object(GitHubDownloader, '_download_with_retry',
-                         lambda self, url, fp, asset, max_retries=3: (fp.parent.mkdir(parents=True, exist_ok=True) or fp.write_text("mock") or True, None)):
+                         lambda self, url, fp, asset, max_retries=3: (fp.parent.mkdir(parents=True, exist_ok=True) or fp.write_text("mock") or True, None, None)):
             coordinator2 = ReleaseDownloadCoordinator(config, 'fake_token')
             results2 = coordinator2.process_monitor_output(monitor_output)
             self.assertEqual(results2['new_downloads'], 0)
@@ -1,30 +1,148 @@
 #!/usr/bin/env python3
 """Integration tests for monitor with download functionality."""
 
+import hashlib
+import io
 import os
 import sys
 import json
+import socket
+import threading
 import tempfile
+import time
 import shutil
-import subprocess
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from typing import Any, Dict
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import requests
+import yaml
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from github_monitor import main as monitor_main
-from download_releases import ReleaseDownloadCoordinator
+from github_downloader import GitHubDownloader, _compile_pattern_set
 from github_version_db import VersionDatabase
 
 
+@dataclass
+class FakeResponse:
+    """Minimal stand-in for requests.Response covering what the monitor and downloader use."""
+    status_code: int = 200
+    payload: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b''
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self.payload) if self.payload is not None else ''
+
+    def json(self) -> Any:
+        return self.payload
+
+    def iter_content(self, chunk_size: int = 1):
+        # A fresh iterator per call lets one shared response serve every download
+        return iter([self.body])
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+# Asset responses carry no per-test state, so build them once and share them
+ASSET_RESPONSE = FakeResponse(headers={'content-length': '12'}, body=b'test content')
+NOT_FOUND_RESPONSE = FakeResponse(status_code=404)
+
+
+# Canonical /releases/latest payload shared by every test; treat as read-only
+BASE_RELEASE = {
+    "tag_name": "v1.25.0",
+    "name": "v1.25.0",
+    "html_url": "https://github.com/kubernetes/kubernetes/releases/tag/v1.25.0",
+    "prerelease": False,
+    "draft": False,
+    "created_at": "2022-08-23T17:00:00Z",
+    "published_at": "2022-08-23T17:00:00Z",
+    "tarball_url": "https://api.github.com/repos/kubernetes/kubernetes/tarball/v1.25.0",
+    "zipball_url": "https://api.github.com/repos/kubernetes/kubernetes/zipball/v1.25.0",
+    "assets": [
+        {
+            "name": "kubernetes.tar.gz",
+            "browser_download_url": "https://github.com/kubernetes/kubernetes/releases/download/v1.25.0/kubernetes.tar.gz",
+            "size": 12,  # Match mock content length
+            "content_type": "application/gzip"
+        },
+        {
+            "name": "kubernetes-src.tar.gz",
+            "browser_download_url": "https://github.com/kubernetes/kubernetes/releases/download/v1.25.0/kubernetes-src.tar.gz",
+            "size": 12,  # Match mock content length
+            "content_type": "application/gzip"
+        }
+    ]
+}
+
+
+class NetworkAccessBlocked(RuntimeError):
+    """Raised when a test tries to reach the network past the mocks."""
+
+
+# URL host -> FakeResponse; reset before each test
+_http_routes: Dict[str, FakeResponse] = {}
+_module_patchers = []
+
+
+def _route_request(session, url, **kwargs):
+    """Serve a mocked requests.Session.get from the routes the current test registered."""
+    response = _http_routes.get(urlsplit(url).netloc)
+    if response is None:
+        raise AssertionError(f"No mocked response registered for {url}")
+    return response
+
+
+def _block_network(*args, **kwargs):
+    raise NetworkAccessBlocked(f"Network access is disabled during tests: {args!r}")
+
+
+def setUpModule():
+    """Install one Session.get router for the module and disable real sockets."""
+    _module_patchers.append(patch.object(requests.Session, 'get', _route_request))
+
+    # Set TEST_ALLOW_NETWORK=true to debug against the live API locally
+    if os.environ.get('TEST_ALLOW_NETWORK', 'false').lower() != 'true':
+        # A code path that bypasses the router fails fast instead of hitting GitHub
+        _module_patchers.extend([
+            patch('socket.getaddrinfo', side_effect=_block_network),
+            patch.object(socket.socket, 'connect', _block_network),
+        ])
+
+    for patcher in _module_patchers:
+        patcher.start()
+
+
+def tearDownModule():
+    """Restore requests.Session.get and real sockets."""
+    while _module_patchers:
+        _module_patchers.pop().stop()
+
+
+# Skip the monitor's rate-limit delay and the downloader's retry backoff
+@patch.object(time, 'sleep', lambda *_: None)
 class TestMonitorDownloadIntegration(unittest.TestCase):
     """Test integration between monitor and download functionality."""
 
     def setUp(self):
         """Create a temporary directory for test files."""
         self.temp_dir = tempfile.mkdtemp()
+        _http_routes.clear()
 
         # Create test configuration
         config = {
@@ -47,71 +165,36 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
         }
 
         self.test_config = Path(self.temp_dir) / "config.yaml"
+        # Keep monitor state per test so runs never share release_state.json in the cwd
+        self.state_file = str(Path(self.temp_dir) / "release_state.json")
+        self.monitor_args = ['--config', str(self.test_config), '--state-file', self.state_file]
         with open(self.test_config, 'w') as f:
-            import yaml
             yaml.dump(config, f)
 
-        # Mock GitHub API response
-        self.mock_github_response = {
-            "tag_name": "v1.25.0",
-            "name": "v1.25.0",
-            "html_url": "https://github.com/kubernetes/kubernetes/releases/tag/v1.25.0",
-            "prerelease": False,
-            "draft": False,
-            "created_at": "2022-08-23T17:00:00Z",
-            "published_at": "2022-08-23T17:00:00Z",
-            "tarball_url": "https://api.github.com/repos/kubernetes/kubernetes/tarball/v1.25.0",
-            "zipball_url": "https://api.github.com/repos/kubernetes/kubernetes/zipball/v1.25.0",
-            "assets": [
-                {
-                    "name": "kubernetes.tar.gz",
-                    "browser_download_url": "https://github.com/kubernetes/kubernetes/releases/download/v1.25.0/kubernetes.tar.gz",
-                    "size": 12,  # Match mock content length
-                    "content_type": "application/gzip"
-                },
-                {
-                    "name": "kubernetes-src.tar.gz",
-                    "browser_download_url": "https://github.com/kubernetes/kubernetes/releases/download/v1.25.0/kubernetes-src.tar.gz",
-                    "size": 12,  # Match mock content length
-                    "content_type": "application/gzip"
-                }
-            ]
-        }
-
     def tearDown(self):
         """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir)
+        # A file still held open (e.g. on Windows) must not fail the test that just passed
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _api_response(self, release):
+        """Build a mocked GitHub API response for the /releases/latest endpoint."""
+        # Single release, not a list
+        return FakeResponse(payload=release, headers={'content-type': 'application/json'})
+
+    def _route_requests(self, api_response, asset_response=None):
+        """Serve GitHub API URLs with api_response and asset URLs with asset_response."""
+        _http_routes['api.github.com'] = api_response
+        if asset_response is not None:
+            _http_routes['github.com'] = asset_response
 
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
-    @patch('requests.Session.get')
-    def test_monitor_with_download_flag(self, mock_get):
+    def test_monitor_with_download_flag(self):
         """Test monitor with --download flag processes new releases."""
-        # Mock GitHub API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = self.mock_github_response  # Single release, not a list
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'application/json'}
-
-        # Mock asset download
-        mock_asset_response = MagicMock()
-        mock_asset_response.iter_content = MagicMock(return_value=[b'test content'])
-        mock_asset_response.status_code = 200
-        mock_asset_response.headers = {'content-length': '12'}
-        mock_asset_response.raise_for_status = MagicMock()
-
-        def mock_get_side_effect(url, **kwargs):
-            if 'api.github.com' in url:
-                return mock_response
-            else:
-                return mock_asset_response
-
-        mock_get.side_effect = mock_get_side_effect
+        self._route_requests(self._api_response(BASE_RELEASE), ASSET_RESPONSE)
 
         # Run monitor with download flag and force-check to ensure release is treated as new
-        sys.argv = ['github_monitor.py', '--config', str(self.test_config), '--download', '--force-check']
-
-        with patch('sys.stdout') as mock_stdout:
-            monitor_main()
+        with redirect_stdout(io.StringIO()):
+            monitor_main(self.monitor_args + ['--download', '--force-check'])
 
         # Verify download directory was created (uses underscore format: owner_repo)
         download_dir = Path(self.temp_dir) / "downloads" / "kubernetes_kubernetes" / "v1.25.0"
@@ -126,21 +209,13 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
         current_version = version_db.get_current_version("kubernetes", "kubernetes")
         self.assertEqual(current_version, "v1.25.0")
 
-    @patch('requests.get')
-    def test_monitor_without_download_flag(self, mock_get):
+    def test_monitor_without_download_flag(self):
         """Test monitor without --download flag doesn't download."""
-        # Mock GitHub API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = [self.mock_github_response]
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'application/json'}
-        mock_get.return_value = mock_response
+        self._route_requests(self._api_response(BASE_RELEASE))
 
         # Run monitor without download flag
-        sys.argv = ['github_monitor.py', '--config', str(self.test_config)]
-
-        with patch('sys.stdout') as mock_stdout:
-            monitor_main()
+        with redirect_stdout(io.StringIO()):
+            monitor_main(self.monitor_args)
 
         # Verify no download directory was created
         download_dir = Path(self.temp_dir) / "downloads"
@@ -151,55 +226,20 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
         self.assertFalse(version_db_path.exists())
 
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
-    @patch('requests.Session.get')
-    def test_monitor_download_only_new_versions(self, mock_get):
+    def test_monitor_download_only_new_versions(self):
         """Test that monitor only downloads truly new versions."""
         # Initialize version database with existing version
         version_db = VersionDatabase(str(Path(self.temp_dir) / "version_db.json"))
         version_db.update_version("kubernetes", "kubernetes", "v1.24.0")
 
-        # Mock the latest release response (v1.25.0) since get_latest_release uses /releases/latest
-        latest_release = {
-            "tag_name": "v1.25.0",
-            "name": "v1.25.0",
-            "html_url": "https://github.com/kubernetes/kubernetes/releases/tag/v1.25.0",
-            "prerelease": False,
-            "draft": False,
-            "created_at": "2022-08-23T17:00:00Z",
-            "published_at": "2022-08-23T17:00:00Z",
-            "tarball_url": "https://api.github.com/repos/kubernetes/kubernetes/tarball/v1.25.0",
-            "zipball_url": "https://api.github.com/repos/kubernetes/kubernetes/zipball/v1.25.0",
-            "assets": [{
-                "name": "kubernetes.tar.gz",
-                "browser_download_url": "https://github.com/kubernetes/kubernetes/releases/download/v1.25.0/kubernetes.tar.gz",
-                "size": 12,  # Match mock content length
-                "content_type": "application/gzip"
-            }]
-        }
+        # Mock the latest release response (v1.25.0, one asset) since get_latest_release uses /releases/latest
+        latest_release = {**BASE_RELEASE, 'assets': BASE_RELEASE['assets'][:1]}
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = latest_release  # Single latest release
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'application/json'}
-
-        mock_asset_response = MagicMock()
-        mock_asset_response.iter_content = MagicMock(return_value=[b'test content'])
-        mock_asset_response.status_code = 200
-        mock_asset_response.headers = {'content-length': '12'}
-
-        def mock_get_side_effect(url, **kwargs):
-            if 'api.github.com' in url:
-                return mock_response
-            else:
-                return mock_asset_response
-
-        mock_get.side_effect = mock_get_side_effect
+        self._route_requests(self._api_response(latest_release), ASSET_RESPONSE)
 
         # Run monitor with download flag and force-check to ensure release is treated as new
-        sys.argv = ['github_monitor.py', '--config', str(self.test_config), '--download', '--force-check']
-
-        with patch('sys.stdout') as mock_stdout:
-            monitor_main()
+        with redirect_stdout(io.StringIO()):
+            monitor_main(self.monitor_args + ['--download', '--force-check'])
 
         # Verify only v1.25.0 was downloaded (not v1.24.0) (uses underscore format: owner_repo)
         v125_dir = Path(self.temp_dir) / "downloads" / "kubernetes_kubernetes" / "v1.25.0"
@@ -212,10 +252,65 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
         current_version = version_db.get_current_version("kubernetes", "kubernetes")
         self.assertEqual(current_version, "v1.25.0")
 
+    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
+    def test_monitor_304_skips_parse(self):
+        """Test an unchanged release (304 for the stored ETag) is neither parsed nor downloaded."""
+        # First run records the ETag of the latest release in the state file
+        first_response = FakeResponse(payload=BASE_RELEASE, headers={'ETag': '"v1.25.0-etag"'})
+        self._route_requests(first_response)
+        with redirect_stdout(io.StringIO()):
+            monitor_main(self.monitor_args)
+
+        with open(self.state_file) as f:
+            state = json.load(f)
+        self.assertEqual(state['repositories']['kubernetes/kubernetes']['etag'], '"v1.25.0-etag"')
+
+        # Second run gets 304 Not Modified for that ETag
+        not_modified = FakeResponse(status_code=304)
+        self._route_requests(not_modified, ASSET_RESPONSE)
+        output = io.StringIO()
+        with patch.object(not_modified, 'json') as mock_json, redirect_stdout(output):
+            monitor_main(self.monitor_args + ['--download'])
+
+        mock_json.assert_not_called()
+        self.assertEqual(json.loads(output.getvalue())['new_releases_found'], 0)
+        self.assertFalse((Path(self.temp_dir) / "downloads").exists())
+
+    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
+    def test_monitor_download_skips_existing_asset(self):
+        """Test an asset already on disk with the served Content-Length is not downloaded again."""
+        release_dir = Path(self.temp_dir) / "downloads" / "kubernetes_kubernetes" / "v1.25.0"
+        release_dir.mkdir(parents=True)
+        existing = release_dir / "kubernetes.tar.gz"
+        existing.write_bytes(b'existing 12b')
+        checksum = hashlib.sha256(b'existing 12b').hexdigest()
+        (release_dir / "kubernetes.tar.gz.sha256").write_text(f"{checksum}  kubernetes.tar.gz\n")
+
+        self._route_requests(self._api_response(BASE_RELEASE), ASSET_RESPONSE)
+
+        verify_download = GitHubDownloader.verify_download
+        verifications = []
+
+        def record_verification(downloader, file_path, expected_checksum=None):
+            verifications.append(verify_download(downloader, file_path, expected_checksum))
+            return verifications[-1]
+
+        output = io.StringIO()
+        with patch.object(GitHubDownloader, 'verify_download', record_verification), \
+                redirect_stdout(output):
+            monitor_main(self.monitor_args + ['--download', '--force-check'])
+
+        download_results = json.loads(output.getvalue())['download_results']
+        self.assertEqual(download_results['failed_downloads'], 0)
+        # Same size as the served asset, so it was kept instead of overwritten
+        self.assertEqual(existing.read_bytes(), b'existing 12b')
+        # The kept file was hashed and checked against its checksum file, not trusted blindly
+        self.assertEqual([(v['file_path'], v['checksum_match']) for v in verifications],
+                         [(str(existing), True)])
+        self.assertEqual((release_dir / "kubernetes-src.tar.gz").read_bytes(), b'test content')
+
     def test_monitor_download_with_asset_patterns(self):
         """Test asset pattern filtering during download."""
-        from github_downloader import GitHubDownloader
-
         # Create downloader to test pattern matching directly
         with patch('requests.Session'):
             downloader = GitHubDownloader('fake_token')
@@ -244,34 +339,20 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
         self.assertTrue(downloader._matches_patterns("kubernetes.tar.gz", patterns_upper))
         self.assertTrue(downloader._matches_patterns("KUBERNETES.TAR.GZ", patterns_upper))
 
+        # Each unique pattern list is compiled once and reused across the checks above
+        self.assertGreater(_compile_pattern_set.cache_info().hits, 0)
+
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}, clear=True)
-    @patch('requests.Session.get')
-    def test_monitor_download_error_handling(self, mock_get):
+    def test_monitor_download_error_handling(self):
         """Test error handling during download process."""
         # Mock GitHub API success but download failure
-        mock_api_response = MagicMock()
-        mock_api_response.json.return_value = self.mock_github_response  # Single release, not a list
-        mock_api_response.status_code = 200
-        mock_api_response.headers = {'content-type': 'application/json'}
-
-        mock_download_response = MagicMock()
-        mock_download_response.status_code = 404
-        mock_download_response.raise_for_status.side_effect = Exception("404 Not Found")
-
-        def mock_get_side_effect(url, **kwargs):
-            if 'api.github.com' in url:
-                return mock_api_response
-            else:
-                return mock_download_response
-
-        mock_get.side_effect = mock_get_side_effect
+        self._route_requests(self._api_response(BASE_RELEASE), NOT_FOUND_RESPONSE)
 
         # Run monitor with download flag and force-check to ensure release is treated as new
-        sys.argv = ['github_monitor.py', '--config', str(self.test_config), '--download', '--force-check']
 
         # Should not raise exception, but should log error
-        with patch('sys.stdout') as mock_stdout:
-            monitor_main()
+        with redirect_stdout(io.StringIO()):
+            monitor_main(self.monitor_args + ['--download', '--force-check'])
 
         # Verify download directory was created but no files downloaded
         download_dir = Path(self.temp_dir) / "downloads"
@@ -282,40 +363,30 @@ class TestMonitorDownloadIntegration(unittest.TestCase):
 
     def test_concurrent_monitor_downloads(self):
         """Test concurrent monitor processes with downloads."""
-        import threading
-        import time
-
         version_db_path = str(Path(self.temp_dir) / "version_db.json")
         version_db = VersionDatabase(version_db_path)
 
-        results = []
+        versions = [f"v1.{i}.0" for i in range(5)]
+        # Hold every worker at the barrier so the updates genuinely overlap
+        barrier = threading.Barrier(len(versions), timeout=10)
 
         def update_version(version):
-            try:
-                version_db.update_version("test", "repo", version)
-                results.append((version, "success"))
-            except Exception as e:
-                results.append((version, str(e)))
-
-        # Create multiple threads trying to update versions
-        threads = []
-        for i in range(5):
-            t = threading.Thread(target=update_version, args=(f"v1.{i}.0",))
-            threads.append(t)
-            t.start()
-
-        # Wait for all threads
-        for t in threads:
-            t.join()
-
-        # All updates should succeed
-        self.assertEqual(len(results), 5)
-        self.assertTrue(all(r[1] == "success" for r in results))
-
-        # Verify database has one of the versions
+            barrier.wait()
+            version_db.update_version("test", "repo", version)
+            return version
+
+        # executor.map re-raises the first worker exception, so all updates must succeed
+        with ThreadPoolExecutor(max_workers=len(versions)) as executor:
+            results = list(executor.map(update_version, versions))
+        self.assertEqual(results, versions)
+
+        # Database must end up consistent: one of the versions won and it is the latest history entry
         current = version_db.get_current_version("test", "repo")
-        self.assertIn(current, [f"v1.{i}.0" for i in range(5)])
+        self.assertIn(current, versions)
 
+        history = version_db.get_download_history("test", "repo")
+        self.assertTrue(history)
+        self.assertEqual(history[0]['version'], current)
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,16 +4,65 @@ Integration test for GitHub Release Monitor
 Tests monitoring this repository's own releases
 """
 
+import io
 import os
 import sys
 import json
 import tempfile
-import subprocess
+import unittest
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
+from unittest.mock import patch
+
+import requests
 
 # Add parent directory to path to import github_monitor
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import github_monitor
+
+# Hand-written GitHub API responses in the API's format, committed so the test never
+# calls the live API; this checks the monitor against a fixture, not against GitHub
+CASSETTE_FILE = Path(__file__).parent / "cassettes" / "monitor_self.json"
+
+
+@contextmanager
+def github_cassette(cassette_file=CASSETTE_FILE):
+    """Replay the cassette's Session.get responses; skip the test if the cassette is missing"""
+    if not cassette_file.exists():
+        raise unittest.SkipTest(f"No GitHub response fixture at {cassette_file}")
+
+    with open(cassette_file, 'r') as f:
+        recorded = json.load(f)
+
+    def replay(session, url, **kwargs):
+        if url not in recorded:
+            raise AssertionError(f"No response for {url} in {cassette_file}")
+        response = requests.Response()
+        response.url = url
+        response.status_code = recorded[url]['status_code']
+        response.headers.update(recorded[url]['headers'])
+        response.encoding = 'utf-8'
+        response._content = recorded[url]['body'].encode('utf-8')
+        return response
+
+    # Replayed responses need no rate limit delay
+    with patch.object(requests.Session, 'get', replay), patch.object(github_monitor.time, 'sleep'):
+        yield
+
+
+def run_monitor(args, capture=True):
+    """Run the monitor in-process, returning its exit status and stdout (None unless captured)"""
+    if not capture:
+        # Discard the report instead of buffering output the caller never reads
+        with open(os.devnull, 'w') as devnull, github_cassette(), redirect_stdout(devnull):
+            return github_monitor.run(args), None
+
+    output = io.StringIO()
+    with github_cassette(), redirect_stdout(output):
+        returncode = github_monitor.run(args)
+    return returncode, output.getvalue()
+
 def create_test_config():
     """Create a test configuration file for monitoring this repository"""
     config = {
@@ -33,16 +82,18 @@ def create_test_config():
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
         import yaml
-        yaml.dump(config, f)
+        # Use the libyaml emitter when PyYAML was built with it
+        yaml.dump(config, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
         return f.name
 
 def test_monitor_repository():
     """Test monitoring this repository for releases"""
     print("=== Integration Test: Monitor Release-Monitor Repository ===\n")
     
-    # Create test configuration
+    # Create test configuration; the state file lives outside the source tree
     config_file = create_test_config()
-    state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_release_state.json")
+    state_dir = tempfile.TemporaryDirectory()
+    state_file = os.path.join(state_dir.name, "test_release_state.json")
     
     try:
         # Clean up any existing state file
@@ -53,25 +104,23 @@ def test_monitor_repository():
         
         # Run the monitor for the first time
         print("\n2. Running initial monitor check...")
-        result = subprocess.run([
-            sys.executable,
-            "github_monitor.py",
+        returncode, stdout = run_monitor([
             "--config", config_file,
             "--state-file", state_file,
             "--force-check"
-        ], capture_output=True, text=True)
+        ])
         
-        if result.returncode != 0:
-            print(f"   ❌ Initial monitor failed: {result.stderr}")
+        if returncode != 0:
+            print(f"   ❌ Initial monitor failed with exit status {returncode} (see log above)")
             return False
         
         print("   ✅ Initial monitor completed successfully")
         
         # Check the output from the monitor
-        if result.stdout:
+        if stdout:
             print("   📋 Monitor output received")
-            # The monitor outputs to stdout/stderr, not to a file directly
-            lines = result.stdout.strip().split('\n')
+            # The monitor writes results to stdout and logs to stderr
+            lines = stdout.strip().split('\n')
             for line in lines[:10]:  # Show first 10 lines
                 if line.strip():
                     print(f"     {line}")
@@ -101,15 +150,13 @@ def test_monitor_repository():
         
         # Run monitor again to test state comparison
         print("\n4. Running monitor again to test state tracking...")
-        result = subprocess.run([
-            sys.executable,
-            "github_monitor.py",
+        returncode, _ = run_monitor([
             "--config", config_file,
             "--state-file", state_file
-        ], capture_output=True, text=True)
+        ], capture=False)
         
-        if result.returncode != 0:
-            print(f"   ❌ Second monitor run failed: {result.stderr}")
+        if returncode != 0:
+            print(f"   ❌ Second monitor run failed with exit status {returncode} (see log above)")
             return False
         
         print("   ✅ State tracking working correctly")
@@ -120,15 +167,13 @@ def test_monitor_repository():
         # Test format parameter
         print("\n5. Testing with format parameter...")
         
-        result = subprocess.run([
-            sys.executable,
-            "github_monitor.py",
+        returncode, _ = run_monitor([
             "--config", config_file,
             "--state-file", state_file,
             "--format", "yaml"
-        ], capture_output=True, text=True)
+        ], capture=False)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("   ✅ Format parameter working")
         else:
             print("   ❌ Format parameter failed")
@@ -137,6 +182,8 @@ def test_monitor_repository():
         print("\n✅ All integration tests passed!")
         return True
         
+    except unittest.SkipTest:
+        raise
     except Exception as e:
         print(f"\n❌ Integration test failed with error: {e}")
         import traceback
@@ -149,19 +196,7 @@ def test_monitor_repository():
             if os.path.exists(file):
                 os.remove(file)
                 print(f"   🧹 Cleaned up: {file}")
-
-def test_monitor_with_new_release():
-    """Test monitoring after creating a new release"""
-    print("\n=== Integration Test: Monitor With New Release ===\n")
-    
-    print("This test would:")
-    print("1. Create a new release using 'make create-release'")
-    print("2. Wait for GitHub to process the release")
-    print("3. Run the monitor to detect the new release")
-    print("4. Verify the new release appears in the output")
-    print("\nNote: This requires GitHub authentication and repository permissions")
-    
-    return True
+        state_dir.cleanup()
 
 def main():
     """Run all integration tests"""
@@ -176,7 +211,6 @@ def main():
     
     tests = [
         ("Monitor Repository", test_monitor_repository),
-        ("Monitor With New Release", test_monitor_with_new_release)
     ]
     
     passed = 0
@@ -191,6 +225,8 @@ def main():
                 passed += 1
             else:
                 failed += 1
+        except unittest.SkipTest as e:
+            print(f"⏭️  Skipped: {e}")
         except Exception as e:
             print(f"❌ Test crashed: {e}")
             failed += 1
@@ -4,9 +4,11 @@ Unit tests for Download Releases Script
 """
 
 import unittest
-import tempfile
 import os
 import json
+import tempfile
+from datetime import datetime, timezone
+from functools import lru_cache
 from unittest.mock import patch, Mock
 import sys
 from pathlib import Path
@@ -14,79 +16,150 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from download_releases import ReleaseDownloadCoordinator
+import download_releases
+from download_releases import ReleaseDownloadCoordinator, load_monitor_output, dump_json
+from github_version_db import VersionDatabase
+
+# Fields shared by every release _create_release_data builds; the empty assets
+# tuple stands in for releases without assets
+RELEASE_TEMPLATE = {
+    'repository': 'test/repo',
+    'tag_name': 'v1.0.0',
+    'assets': (),
+    'prerelease': False
+}
+
+# Default asset patterns of the test configuration; a tuple so no test can change
+# them, copied into a list where config.yaml would provide one
+ASSET_PATTERNS = ('*.tar.gz', '*.zip')
+
+# Tags similar to, but not exactly, target version v1.5.0
+NON_MATCHING_TARGET_TAGS = (
+    'v1.5.1',      # Different patch
+    'v1.4.0',      # Different minor
+    'v2.5.0',      # Different major
+    'v1.5.0-beta', # With suffix
+    '1.5.0',       # Missing v prefix
+    'V1.5.0'       # Different case
+)
+
+# Monitor output fixtures; process_monitor_output only reads its input, so
+# the tests share them
+MONITOR_OUTPUT_TWO_REPOS = {
+    'releases': [
+        {
+            'repository': 'test/repo1',
+            'tag_name': 'v1.0.0',
+            'assets': [
+                {
+                    'name': 'release.tar.gz',
+                    'browser_download_url': 'https://example.com/release.tar.gz'
+                }
+            ]
+        },
+        {
+            'repository': 'test/repo2',
+            'tag_name': 'v2.0.0',
+            'assets': [
+                {
+                    'name': 'app.zip',
+                    'browser_download_url': 'https://example.com/app.zip'
+                }
+            ]
+        }
+    ]
+}
 
+MONITOR_OUTPUT_MIXED_RESULTS = {
+    'releases': [
+        {
+            'repository': 'test/success-repo',
+            'tag_name': 'v1.0.0',
+            'assets': [{'name': 'file.tar.gz', 'browser_download_url': 'https://example.com/file.tar.gz'}]
+        },
+        {
+            'repository': 'test/fail-repo',
+            'tag_name': 'v1.0.0',
+            'assets': [{'name': 'file.tar.gz', 'browser_download_url': 'https://example.com/file.tar.gz'}]
+        },
+        {
+            'repository': 'test/no-assets',
+            'tag_name': 'v1.0.0',
+            'assets': []
+        }
+    ]
+}
 
-class TestReleaseDownloadCoordinator(unittest.TestCase):
 
-    def setUp(self):
-        """Set up test environment with proper mocks and fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+@lru_cache(maxsize=None)
+def _source_urls(repository, tag_name):
+    """Tarball and zipball URLs of a release; tests ask for the same few repeatedly."""
+    return {
+        'tarball_url': f'https://api.github.com/repos/{repository}/tarball/{tag_name}',
+        'zipball_url': f'https://api.github.com/repos/{repository}/zipball/{tag_name}'
+    }
 
-        # Create test configuration
-        self.config = {
+
+class TestReleaseDownloadCoordinator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one coordinator for the class; setUp resets the state tests change."""
+        # Create test configuration; the downloader is mocked and the database lives
+        # in memory, so nothing is ever written under the download directory
+        cls.config = {
             'download': {
-                'directory': os.path.join(self.temp_dir, 'downloads'),
-                'version_db': os.path.join(self.temp_dir, 'versions.json'),
+                'directory': '/nonexistent/downloads',
+                'version_db': ':memory:',
                 'include_prereleases': False,
-                'asset_patterns': ['*.tar.gz', '*.zip'],
+                'asset_patterns': list(ASSET_PATTERNS),
                 'verify_downloads': True,
                 'cleanup_old_versions': False,
-                'keep_versions': 5
+                'keep_versions': 5,
+                'max_concurrent_downloads': 4
             }
         }
 
-        # Mock environment variables to prevent Artifactory usage
-        self.env_patcher = patch.dict(os.environ, {
-            'ARTIFACTORY_URL': '',
-            'ARTIFACTORY_REPOSITORY': '',
-            'ARTIFACTORY_API_KEY': '',
-            'ARTIFACTORY_USERNAME': '',
-            'ARTIFACTORY_PASSWORD': ''
-        }, clear=False)
-        self.env_patcher.start()
-
-        # Mock GitHubDownloader to avoid network initialization
-        self.downloader_patcher = patch('download_releases.GitHubDownloader')
-        mock_downloader_class = self.downloader_patcher.start()
-        mock_downloader = Mock()
-        mock_downloader_class.return_value = mock_downloader
-
-        self.coordinator = ReleaseDownloadCoordinator(self.config, 'test_token')
-        self.mock_downloader = mock_downloader
-
-    def tearDown(self):
-        """Clean up test environment."""
-        # Stop all patchers
-        self.env_patcher.stop()
-        self.downloader_patcher.stop()
-
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        # Build with an empty environment so neither Artifactory nor S3 storage is
+        # auto-detected, and mock GitHubDownloader to avoid network initialization
+        with patch.dict(os.environ, {}, clear=True), \
+                patch('download_releases.GitHubDownloader') as downloader_class:
+            cls.coordinator = ReleaseDownloadCoordinator(cls.config, 'test_token')
+        cls.downloader_class = downloader_class
+
+    def setUp(self):
+        """Reset the shared coordinator before each test."""
+        self._reset_coordinator()
+
+    def _reset_coordinator(self):
+        """Give the shared coordinator a fresh version database, downloader and overrides."""
+        # No test checks what lands on disk, so keep the database in memory
+        self.coordinator.version_db = VersionDatabase(':memory:')
+        self.coordinator.repository_overrides = {}
+        self.coordinator.version_comparator.include_prereleases = False
+
+        self.mock_downloader = Mock()
+        self.coordinator.downloader = self.mock_downloader
 
     def _create_release_data(self, repository='test/repo', tag_name='v1.0.0',
                            has_assets=True, has_source=True, prerelease=False, assets=None):
         """Helper method to create properly formatted release data with all required fields."""
-        if assets is None:
-            assets = [
+        release_data = dict(RELEASE_TEMPLATE, repository=repository, tag_name=tag_name,
+                            prerelease=prerelease)
+
+        if assets is not None:
+            release_data['assets'] = assets
+        elif has_assets:
+            release_data['assets'] = [
                 {
                     'name': 'release.tar.gz',
                     'browser_download_url': f'https://example.com/{tag_name}/release.tar.gz'
                 }
-            ] if has_assets else []
-
-        release_data = {
-            'repository': repository,
-            'tag_name': tag_name,
-            'assets': assets,
-            'prerelease': prerelease
-        }
+            ]
 
         # Add source URLs if requested
         if has_source:
-            release_data['tarball_url'] = f'https://api.github.com/repos/{repository}/tarball/{tag_name}'
-            release_data['zipball_url'] = f'https://api.github.com/repos/{repository}/zipball/{tag_name}'
+            release_data.update(_source_urls(repository, tag_name))
 
         return release_data
 
@@ -94,9 +167,14 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
         """Test coordinator initialization."""
         self.assertIsNotNone(self.coordinator.version_db)
         self.assertIsNotNone(self.coordinator.version_comparator)
-        # Verify downloader was mocked
-        self.assertEqual(self.coordinator.downloader, self.mock_downloader)
-        self.assertEqual(self.coordinator.asset_patterns, ['*.tar.gz', '*.zip'])
+        # The download settings reach the downloader, with defaults for the ones not configured
+        self.downloader_class.assert_called_once_with(
+            token='test_token',
+            download_dir='/nonexistent/downloads',
+            timeout=300,
+            max_concurrent_downloads=4
+        )
+        self.assertEqual(self.coordinator.asset_patterns, list(ASSET_PATTERNS))
 
     def test_process_single_release_new_version(self):
         """Test processing a new release version."""
@@ -121,67 +199,54 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
         self.assertIn('download_results', result)
         self.assertIn('metadata', result)
 
-    def test_process_single_release_older_version(self):
-        """Test processing an older release version."""
-        # First, add a newer version to the database
-        self.coordinator.version_db.update_version('test', 'repo', 'v2.0.0')
-
-        release = self._create_release_data(tag_name='v1.0.0')
-
-        result = self.coordinator._process_single_release(release)
-
-        self.assertEqual(result['action'], 'skipped')
-        self.assertIn('not newer than', result['reason'])
-        self.mock_downloader.download_release_content.assert_not_called()
-
-    def test_process_single_release_no_assets(self):
-        """Test processing a release with no assets."""
-        release = self._create_release_data(tag_name='v1.0.0', has_assets=False, has_source=False)
-
-        result = self.coordinator._process_single_release(release)
-
-        self.assertEqual(result['action'], 'skipped')
-        self.assertEqual(result['reason'], 'No downloadable content (no assets or source archives)')
-
-    def test_process_single_release_invalid_repository(self):
-        """Test processing a release with invalid repository format."""
-        release = {
-            'repository': 'invalid-repo-name',
-            'tag_name': 'v1.0.0',
-            'assets': []
-        }
-
-        result = self.coordinator._process_single_release(release)
-
-        self.assertEqual(result['action'], 'failed')
-        self.assertEqual(result['reason'], 'Invalid repository format')
-
-    def test_process_single_release_download_failure(self):
-        """Test processing when download fails."""
-        # Mock failed download
-        self.mock_downloader.download_release_content.return_value = [
-            {
-                'success': False,
-                'asset_name': 'release.tar.gz',
-                'error': 'Network error'
-            }
+    def test_process_single_release_skips_and_failures(self):
+        """Test the skip and failure branches of processing a single release."""
+        cases = [
+            # (description, stored version, download results, release, action, reason)
+            ('older version', 'v2.0.0', None,
+             self._create_release_data(tag_name='v1.0.0'),
+             'skipped', 'not newer than'),
+            ('no assets', None, None,
+             self._create_release_data(tag_name='v1.0.0', has_assets=False, has_source=False),
+             'skipped', 'No downloadable content (no assets or source archives)'),
+            ('invalid repository', None, None,
+             {'repository': 'invalid-repo-name', 'tag_name': 'v1.0.0', 'assets': []},
+             'failed', 'Invalid repository format'),
+            ('repository with empty owner', None, None,
+             {'repository': '/repo', 'tag_name': 'v1.0.0', 'assets': []},
+             'failed', 'Invalid repository format'),
+            ('repository with extra path', None, None,
+             {'repository': 'test/repo/extra', 'tag_name': 'v1.0.0', 'assets': []},
+             'failed', 'Invalid repository format'),
+            ('download failure', None,
+             [{'success': False, 'asset_name': 'release.tar.gz', 'error': 'Network error'}],
+             {
+                 'repository': 'test/repo',
+                 'tag_name': 'v1.0.0',
+                 'assets': [
+                     {
+                         'name': 'release.tar.gz',
+                         'browser_download_url': 'https://example.com/release.tar.gz'
+                     }
+                 ]
+             },
+             'failed', 'All asset downloads failed'),
         ]
 
-        release = {
-            'repository': 'test/repo',
-            'tag_name': 'v1.0.0',
-            'assets': [
-                {
-                    'name': 'release.tar.gz',
-                    'browser_download_url': 'https://example.com/release.tar.gz'
-                }
-            ]
-        }
+        for description, stored_version, download_results, release, action, reason in cases:
+            with self.subTest(description):
+                self._reset_coordinator()
+                if stored_version:
+                    self.coordinator.version_db.update_version('test', 'repo', stored_version)
+                if download_results:
+                    self.mock_downloader.download_release_content.return_value = download_results
 
-        result = self.coordinator._process_single_release(release)
+                result = self.coordinator._process_single_release(release)
 
-        self.assertEqual(result['action'], 'failed')
-        self.assertEqual(result['reason'], 'All asset downloads failed')
+                self.assertEqual(result['action'], action)
+                self.assertIn(reason, result['reason'])
+                if download_results is None:
+                    self.mock_downloader.download_release_content.assert_not_called()
 
     def test_process_monitor_output(self):
         """Test processing complete monitor output."""
@@ -196,32 +261,7 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
             }
         ]
 
-        monitor_output = {
-            'releases': [
-                {
-                    'repository': 'test/repo1',
-                    'tag_name': 'v1.0.0',
-                    'assets': [
-                        {
-                            'name': 'release.tar.gz',
-                            'browser_download_url': 'https://example.com/release.tar.gz'
-                        }
-                    ]
-                },
-                {
-                    'repository': 'test/repo2',
-                    'tag_name': 'v2.0.0',
-                    'assets': [
-                        {
-                            'name': 'app.zip',
-                            'browser_download_url': 'https://example.com/app.zip'
-                        }
-                    ]
-                }
-            ]
-        }
-
-        results = self.coordinator.process_monitor_output(monitor_output)
+        results = self.coordinator.process_monitor_output(MONITOR_OUTPUT_TWO_REPOS)
 
         self.assertEqual(results['total_releases_checked'], 2)
         self.assertEqual(results['new_downloads'], 2)
@@ -231,9 +271,7 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
 
     def test_process_monitor_output_empty(self):
         """Test processing empty monitor output."""
-        monitor_output = {'releases': []}
-
-        results = self.coordinator.process_monitor_output(monitor_output)
+        results = self.coordinator.process_monitor_output({'releases': []})
 
         self.assertEqual(results['total_releases_checked'], 0)
         self.assertEqual(results['new_downloads'], 0)
@@ -241,9 +279,7 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
 
     def test_process_monitor_output_no_releases_key(self):
         """Test processing monitor output without releases key."""
-        monitor_output = {}
-
-        results = self.coordinator.process_monitor_output(monitor_output)
+        results = self.coordinator.process_monitor_output({})
 
         self.assertEqual(results['total_releases_checked'], 0)
         self.assertEqual(results['new_downloads'], 0)
@@ -260,32 +296,36 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
 
         self.mock_downloader.download_release_content.side_effect = mock_download_side_effect
 
+        results = self.coordinator.process_monitor_output(MONITOR_OUTPUT_MIXED_RESULTS)
+
+        self.assertEqual(results['total_releases_checked'], 3)
+        self.assertEqual(results['new_downloads'], 1)
+        self.assertEqual(results['skipped_releases'], 1)  # no assets
+        self.assertEqual(results['failed_downloads'], 1)
+
+    def test_process_monitor_output_reads_stored_version_once_per_repository(self):
+        """Test that releases of one repository share a single version database read."""
+        self.mock_downloader.download_release_content.return_value = [
+            {'success': True, 'asset_name': 'release.tar.gz', 'file_path': '/path/to/release.tar.gz'}
+        ]
         monitor_output = {
             'releases': [
-                {
-                    'repository': 'test/success-repo',
-                    'tag_name': 'v1.0.0',
-                    'assets': [{'name': 'file.tar.gz', 'browser_download_url': 'https://example.com/file.tar.gz'}]
-                },
-                {
-                    'repository': 'test/fail-repo',
-                    'tag_name': 'v1.0.0',
-                    'assets': [{'name': 'file.tar.gz', 'browser_download_url': 'https://example.com/file.tar.gz'}]
-                },
-                {
-                    'repository': 'test/no-assets',
-                    'tag_name': 'v1.0.0',
-                    'assets': []
-                }
+                self._create_release_data(tag_name='v1.1.0'),
+                self._create_release_data(tag_name='v1.0.0'),
+                self._create_release_data(tag_name='v1.2.0')
             ]
         }
 
-        results = self.coordinator.process_monitor_output(monitor_output)
+        version_db = self.coordinator.version_db
+        with patch.object(version_db, 'get_current_version',
+                          wraps=version_db.get_current_version) as mock_get_current_version:
+            results = self.coordinator.process_monitor_output(monitor_output)
 
-        self.assertEqual(results['total_releases_checked'], 3)
-        self.assertEqual(results['new_downloads'], 1)
-        self.assertEqual(results['skipped_releases'], 1)  # no assets
-        self.assertEqual(results['failed_downloads'], 1)
+        mock_get_current_version.assert_called_once_with('test', 'repo')
+        # v1.0.0 is compared against v1.1.0, downloaded earlier in the same run
+        self.assertEqual([r['action'] for r in results['download_results']],
+                         ['downloaded', 'skipped', 'downloaded'])
+        self.assertEqual(results['download_results'][2]['previous_version'], 'v1.1.0')
 
     def test_get_status_report(self):
         """Test status report generation."""
@@ -301,7 +341,7 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
         # Check config values
         config = status['config']
         self.assertIn('download_directory', config)
-        self.assertEqual(config['asset_patterns'], ['*.tar.gz', '*.zip'])
+        self.assertEqual(config['asset_patterns'], list(ASSET_PATTERNS))
         self.assertFalse(config['include_prereleases'])
 
     def test_prerelease_handling(self):
@@ -325,48 +365,24 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
 
     def test_prerelease_handling_enabled(self):
         """Test pre-release handling when enabled."""
-        # Create fresh temp directory and config for this test
-        import tempfile
-        fresh_temp_dir = tempfile.mkdtemp()
+        # setUp turns pre-releases back off for the next test
+        self.coordinator.version_comparator.include_prereleases = True
 
-        config_with_prereleases = {
-            'download': {
-                'directory': os.path.join(fresh_temp_dir, 'downloads'),
-                'version_db': os.path.join(fresh_temp_dir, 'versions.json'),
-                'include_prereleases': True,
-                'asset_patterns': ['*.tar.gz', '*.zip'],
-                'verify_downloads': True,
-                'cleanup_old_versions': False,
-                'keep_versions': 5
+        self.mock_downloader.download_release_content.return_value = [
+            {
+                'success': True,
+                'asset_name': 'release.tar.gz',
+                'file_path': '/path/to/release.tar.gz',
+                'file_size': 1024,
+                'download_time': 1.5
             }
-        }
-
-        with patch('download_releases.GitHubDownloader') as mock_downloader_class, \
-             patch.dict(os.environ, {'ARTIFACTORY_URL': '', 'ARTIFACTORY_REPOSITORY': ''}, clear=False):
-            mock_downloader = Mock()
-            mock_downloader_class.return_value = mock_downloader
-
-            coordinator = ReleaseDownloadCoordinator(config_with_prereleases, 'test_token')
-
-            mock_downloader.download_release_content.return_value = [
-                {
-                    'success': True,
-                    'asset_name': 'release.tar.gz',
-                    'file_path': '/path/to/release.tar.gz',
-                    'file_size': 1024,
-                    'download_time': 1.5
-                }
-            ]
-
-            release = self._create_release_data(tag_name='v1.0.0-alpha.1', prerelease=True)
+        ]
 
-            result = coordinator._process_single_release(release)
+        release = self._create_release_data(tag_name='v1.0.0-alpha.1', prerelease=True)
 
-            self.assertEqual(result['action'], 'downloaded')
+        result = self.coordinator._process_single_release(release)
 
-        # Clean up fresh temp directory
-        import shutil
-        shutil.rmtree(fresh_temp_dir)
+        self.assertEqual(result['action'], 'downloaded')
 
     def test_target_version_matching(self):
         """Test target version matching logic."""
@@ -438,17 +454,7 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
             }
         }
 
-        # Test similar but non-matching versions
-        non_matching_cases = [
-            'v1.5.1',      # Different patch
-            'v1.4.0',      # Different minor
-            'v2.5.0',      # Different major
-            'v1.5.0-beta', # With suffix
-            '1.5.0',       # Missing v prefix
-            'V1.5.0'       # Different case
-        ]
-
-        for tag_name in non_matching_cases:
+        for tag_name in NON_MATCHING_TARGET_TAGS:
             with self.subTest(tag_name=tag_name):
                 release = self._create_release_data(tag_name=tag_name)
                 result = self.coordinator._process_single_release(release)
@@ -642,20 +648,45 @@ class TestReleaseDownloadCoordinator(unittest.TestCase):
         results = self.coordinator.process_monitor_output(monitor_output)
 
         # Should have 2 downloads (matching target versions) and 2 skips
-        self.assertEqual(results['new_downloads'], 2)
-        self.assertEqual(results['skipped_releases'], 2)
-
-        # Verify specific results
-        downloaded = [r for r in results['download_results'] if r['action'] == 'downloaded']
+        downloaded = sorted((r['repository'], r['tag_name'])
+                            for r in results['download_results'] if r['action'] == 'downloaded')
         skipped = [r for r in results['download_results'] if r['action'] == 'skipped']
+        self.assertEqual(
+            {
+                'new_downloads': results['new_downloads'],
+                'skipped_releases': results['skipped_releases'],
+                'skipped_results': len(skipped),
+                'downloaded': downloaded
+            },
+            {
+                'new_downloads': 2,
+                'skipped_releases': 2,
+                'skipped_results': 2,
+                'downloaded': [('target/repo1', 'v1.5.0'), ('target/repo2', 'v2.0.0')]
+            }
+        )
+
+
+class TestJsonInputOutput(unittest.TestCase):
+
+    def test_monitor_output_round_trip(self):
+        """Test monitor output loads and reports dump alike with and without orjson."""
+        monitor_output = {'releases': [{'repository': 'test/repo', 'tag_name': 'v1.0.0', 'name': 'café'}]}
+        results = {'finished_at': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 'count': 1,
+                   'by_status': {200: 3, None: 1}}
 
-        self.assertEqual(len(downloaded), 2)
-        self.assertEqual(len(skipped), 2)
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+            json.dump(monitor_output, f)
+        self.addCleanup(os.remove, f.name)
 
-        # Check that the right releases were downloaded
-        downloaded_tags = {r['repository']: r['tag_name'] for r in downloaded}
-        self.assertEqual(downloaded_tags.get('target/repo1'), 'v1.5.0')
-        self.assertEqual(downloaded_tags.get('target/repo2'), 'v2.0.0')
+        # The orjson path only runs where orjson is installed
+        for orjson_available in {download_releases.ORJSON_AVAILABLE, False}:
+            with self.subTest(orjson_available=orjson_available), \
+                    patch.object(download_releases, 'ORJSON_AVAILABLE', orjson_available):
+                self.assertEqual(load_monitor_output(f.name), monitor_output)
+                self.assertEqual(json.loads(dump_json(results)),
+                                 {'finished_at': '2024-01-02 03:04:05+00:00', 'count': 1,
+                                  'by_status': {'200': 3, 'null': 1}})
 
 
 if __name__ == '__main__':
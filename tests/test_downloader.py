@@ -7,7 +7,11 @@ import unittest
 import tempfile
 import os
 import json
+import fnmatch
 import hashlib
+import threading
+import requests
+from urllib3 import HTTPResponse
 from unittest.mock import patch, Mock, MagicMock
 import sys
 from pathlib import Path
@@ -15,7 +19,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from github_downloader import GitHubDownloader
+from github_downloader import GitHubDownloader, CappedRetry, MAX_RETRY_AFTER, STATUS_RETRY
 
 
 class TestGitHubDownloader(unittest.TestCase):
@@ -50,6 +54,26 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertEqual(self.downloader.timeout, 10)
         # Verify session was mocked
         self.assertEqual(self.downloader.session, self.mock_session)
+
+    def test_session_pool_fits_concurrent_downloads(self):
+        """Test the connection pool keeps a connection per concurrent download."""
+        downloader = GitHubDownloader(download_dir=self.temp_dir, max_concurrent_downloads=16)
+
+        adapter = downloader.session.get_adapter('https://github.com')
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+        self.assertTrue(adapter.max_retries.respect_retry_after_header)
+
+    def test_status_retry_caps_retry_after(self):
+        """Test a huge Retry-After waits MAX_RETRY_AFTER seconds instead of stalling the run."""
+        response = HTTPResponse(status=503, headers={'Retry-After': '86400'})
+
+        with patch('urllib3.util.retry.time.sleep') as mock_sleep:
+            retry = STATUS_RETRY.increment('GET', '/asset', response=response)
+            retry.sleep(response)
+
+        self.assertIsInstance(retry, CappedRetry)
+        mock_sleep.assert_called_once_with(MAX_RETRY_AFTER)
     
     def test_pattern_matching(self):
         """Test asset pattern matching."""
@@ -72,6 +96,29 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertTrue(self.downloader._matches_patterns('file.zip', patterns))
         self.assertTrue(self.downloader._matches_patterns('FILE.ZIP', patterns))
         self.assertTrue(self.downloader._matches_patterns('release.tar.gz', patterns))
+
+    def test_pattern_matching_agrees_with_fnmatch(self):
+        """Test suffix, literal and wildcard pattern lists all match like fnmatch."""
+        names = ['app.tar.gz', 'APP.ZIP', 'app-linux-amd64.tar.gz', 'checksums.txt', 'app.tar.gz.sig']
+        pattern_lists = [
+            ['*.tar.gz', '*.zip'],                 # suffixes only
+            ['checksums.txt', 'APP.zip'],          # literals only
+            ['*-amd64.tar.gz', 'app.?ip'],         # wildcards
+            ['*'],
+        ]
+        for patterns in pattern_lists:
+            for name in names:
+                with self.subTest(patterns=patterns, name=name):
+                    expected = any(fnmatch.fnmatch(name.lower(), p.lower()) for p in patterns)
+                    self.assertEqual(self.downloader._matches_patterns(name, patterns), expected)
+
+    def test_filter_assets(self):
+        """Test filtering assets by name keeps matches in their original order."""
+        assets = [{'name': name} for name in ('b.zip', 'a.tar.gz', 'sources.zip', 'readme.txt')]
+
+        self.assertEqual(self.downloader.filter_assets(assets, ['*.tar.gz', '*.zip', '!sources*']),
+                         [{'name': 'b.zip'}, {'name': 'a.tar.gz'}])
+        self.assertEqual(self.downloader.filter_assets(assets, ['!*.txt']), [])
     
     def test_download_with_retry_success(self):
         """Test successful download with retry logic."""
@@ -87,12 +134,13 @@ class TestGitHubDownloader(unittest.TestCase):
         
         # Test the download
         asset = {'size': 12}  # Length of 'test content'
-        success, error = self.downloader._download_with_retry(
+        success, error, verification = self.downloader._download_with_retry(
             'https://example.com/file.txt', test_file, asset
         )
         
         self.assertTrue(success)
         self.assertIsNone(error)
+        self.assertEqual(verification['sha256'], hashlib.sha256(b'test content').hexdigest())
         self.assertTrue(test_file.exists())
         self.assertEqual(test_file.read_text(), 'test content')
         
@@ -100,6 +148,124 @@ class TestGitHubDownloader(unittest.TestCase):
         checksum_file = test_file.with_suffix('.txt.sha256')
         self.assertTrue(checksum_file.exists())
     
+    def test_download_with_retry_skips_empty_chunks(self):
+        """Test empty chunks mid-stream neither end nor change the download."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {}
+        # Keep-alive chunks and a decoder still buffering input both yield b''
+        mock_response.iter_content.return_value = [b'test ', b'', b'content']
+        self.mock_session.get.return_value = mock_response
+
+        test_file = Path(self.temp_dir) / 'test.txt'
+        success, error, verification = self.downloader._download_with_retry(
+            'https://example.com/file.txt', test_file, {}
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(test_file.read_bytes(), b'test content')
+        self.assertEqual(verification['sha256'], hashlib.sha256(b'test content').hexdigest())
+
+    def test_download_single_asset_reuses_streamed_checksum(self):
+        """Test a fresh download is checked against the published digest without re-reading it."""
+        checksum = hashlib.sha256(b'test content').hexdigest()
+        cases = [
+            # (asset digest, expected checksum_match); without a digest nothing is compared
+            (None, None),
+            (f'sha256:{checksum.upper()}', True),
+        ]
+
+        for digest, checksum_match in cases:
+            with self.subTest(digest=digest):
+                mock_response = Mock()
+                mock_response.raise_for_status.return_value = None
+                mock_response.headers = {'content-length': '12'}
+                mock_response.iter_content.return_value = [b'test content']
+                self.mock_session.get.return_value = mock_response
+
+                asset = {
+                    'name': 'test.txt',
+                    'browser_download_url': 'https://example.com/test.txt',
+                    'size': 12,
+                    'digest': digest
+                }
+                release_dir = Path(tempfile.mkdtemp(dir=self.temp_dir))
+
+                with patch.object(self.downloader, 'verify_download') as mock_verify:
+                    result = self.downloader._download_single_asset(asset, release_dir, {})
+
+                mock_verify.assert_not_called()
+                self.assertTrue(result['success'])
+                self.assertEqual(result['verification']['sha256'], checksum)
+                self.assertEqual(result['verification']['checksum_match'], checksum_match)
+
+    @patch('time.sleep')
+    def test_download_with_retry_rejects_published_digest_mismatch(self, mock_sleep):
+        """Test a download that doesn't match the asset's published digest fails."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [b'test content']
+        self.mock_session.get.return_value = mock_response
+
+        test_file = Path(self.temp_dir) / 'test.txt'
+        asset = {'size': 12, 'digest': 'sha256:' + '0' * 64}
+        success, error, verification = self.downloader._download_with_retry(
+            'https://example.com/file.txt', test_file, asset, max_retries=0
+        )
+
+        self.assertFalse(success)
+        self.assertIn("published checksum", error)
+        self.assertIsNone(verification)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_download_single_asset_keeps_verified_file(self):
+        """Test a file matching its size and checksum file is not downloaded again."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {'content-length': '12'}
+        self.mock_session.get.return_value = mock_response
+
+        existing = Path(self.temp_dir) / 'test.txt'
+        existing.write_bytes(b'test content')
+        checksum = hashlib.sha256(b'test content').hexdigest()
+        existing.with_suffix('.txt.sha256').write_text(f'{checksum}  test.txt\n')
+
+        asset = {
+            'name': 'test.txt',
+            'browser_download_url': 'https://example.com/test.txt',
+            'size': 12
+        }
+        result = self.downloader._download_single_asset(asset, Path(self.temp_dir), {})
+
+        mock_response.iter_content.assert_not_called()
+        self.assertTrue(result['success'])
+        self.assertTrue(result['verification']['checksum_match'])
+
+    def test_download_single_asset_replaces_corrupt_file(self):
+        """Test a file of the right size that fails its checksum is downloaded again."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.headers = {'content-length': '12'}
+        mock_response.iter_content.return_value = [b'test content']
+        self.mock_session.get.return_value = mock_response
+
+        existing = Path(self.temp_dir) / 'test.txt'
+        existing.write_bytes(b'tampered!!!!')
+        checksum = hashlib.sha256(b'test content').hexdigest()
+        existing.with_suffix('.txt.sha256').write_text(f'{checksum}  test.txt\n')
+
+        asset = {
+            'name': 'test.txt',
+            'browser_download_url': 'https://example.com/test.txt',
+            'size': 12
+        }
+        result = self.downloader._download_single_asset(asset, Path(self.temp_dir), {})
+
+        self.assertTrue(result['success'])
+        self.assertEqual(existing.read_bytes(), b'test content')
+        self.assertEqual(result['verification']['sha256'], checksum)
+
     @patch('time.sleep')
     def test_download_with_retry_failure(self, mock_sleep):
         """Test download failure and retry logic."""
@@ -109,13 +275,32 @@ class TestGitHubDownloader(unittest.TestCase):
         test_file = Path(self.temp_dir) / 'test.txt'
         asset = {'size': 1024}
         
-        success, error = self.downloader._download_with_retry(
+        success, error, verification = self.downloader._download_with_retry(
             'https://example.com/file.txt', test_file, asset, max_retries=2
         )
         
         self.assertFalse(success)
         self.assertIn("Failed after 3 attempts", error)
+        self.assertIsNone(verification)
         self.assertFalse(test_file.exists())
+
+    @patch('time.sleep')
+    def test_download_with_retry_error_status_not_retried(self, mock_sleep):
+        """Test error statuses fail at once, as the session adapter already retried them."""
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError("503 Server Error")
+        self.mock_session.get.return_value = mock_response
+
+        success, error, verification = self.downloader._download_with_retry(
+            'https://example.com/file.txt', Path(self.temp_dir) / 'test.txt', {'size': 1024}
+        )
+
+        self.assertFalse(success)
+        self.assertIn("Failed after 1 attempts", error)
+        self.assertIsNone(verification)
+        self.assertEqual(self.mock_session.get.call_count, 1)
+        mock_sleep.assert_not_called()
+        self.assertEqual(os.listdir(self.temp_dir), [])
     
     def test_verify_download_success(self):
         """Test download verification with correct checksum."""
@@ -137,6 +322,18 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertEqual(result['sha256'], expected_hash)
         self.assertEqual(result['file_size'], len(test_content))
     
+    def test_verify_download_without_file_digest(self):
+        """Test download verification on Pythons without hashlib.file_digest."""
+        test_content = b'test file content' * 1000
+        test_file = Path(self.temp_dir) / 'test.txt'
+        test_file.write_bytes(test_content)
+
+        with patch('github_downloader.hashlib', Mock(spec=['sha256'], sha256=hashlib.sha256)):
+            result = self.downloader.verify_download(test_file)
+
+        self.assertTrue(result['verified'])
+        self.assertEqual(result['sha256'], hashlib.sha256(test_content).hexdigest())
+
     def test_verify_download_checksum_mismatch(self):
         """Test download verification with incorrect checksum."""
         # Create test file
@@ -155,6 +352,23 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertFalse(result['checksum_match'])  # But checksum doesn't match
         self.assertIn('error', result)
     
+    def test_stored_checksum_formats(self):
+        """Test checksum files are read whatever whitespace separates the fields."""
+        test_file = Path(self.temp_dir) / 'test.txt'
+        checksum = hashlib.sha256(b'test').hexdigest()
+        cases = [
+            (f'{checksum}  test.txt\n', checksum),
+            (f'{checksum}\ttest.txt\n', checksum),
+            (f'  {checksum}  test.txt\n', checksum),
+            (f'{checksum}\n', checksum),
+            ('\n', None),
+        ]
+
+        for content, expected in cases:
+            with self.subTest(content=content):
+                test_file.with_suffix('.txt.sha256').write_text(content)
+                self.assertEqual(self.downloader._stored_checksum(test_file), expected)
+
     def test_verify_download_missing_file(self):
         """Test verification of non-existent file."""
         test_file = Path(self.temp_dir) / 'nonexistent.txt'
@@ -189,6 +403,21 @@ class TestGitHubDownloader(unittest.TestCase):
         self.assertEqual(stats['total_files'], 2)
         self.assertEqual(stats['total_size'], 16)  # 8 + 8 bytes
         self.assertEqual(stats['repositories'], 1)
+
+    def test_download_stats_across_repositories(self):
+        """Test download stats add up every repository and version."""
+        for repo in ('repo_a', 'repo_b', 'repo_c'):
+            for version in ('v1.0.0', 'v2.0.0'):
+                version_dir = Path(self.temp_dir) / repo / version
+                version_dir.mkdir(parents=True)
+                (version_dir / 'file.bin').write_bytes(b'x' * 10)
+                (version_dir / 'file.bin.sha256').write_text('checksum')
+
+        stats = self.downloader.get_download_stats()
+
+        self.assertEqual(stats['total_files'], 6)
+        self.assertEqual(stats['total_size'], 60)
+        self.assertEqual(stats['repositories'], 3)
     
     def test_cleanup_old_downloads(self):
         """Test cleanup of old downloaded versions."""
@@ -225,7 +454,7 @@ class TestGitHubDownloader(unittest.TestCase):
     def test_download_release_assets_success(self, mock_download):
         """Test downloading release assets."""
         # Mock successful download
-        mock_download.return_value = (True, None)
+        mock_download.return_value = (True, None, None)
         
         # Create test release data
         release_data = {
@@ -274,7 +503,34 @@ class TestGitHubDownloader(unittest.TestCase):
             
             # Should only download 2 assets (tar.gz and zip)
             self.assertEqual(len(results), 2)
+            self.assertEqual([c.args[0]['name'] for c in mock_download.call_args_list],
+                             ['release.tar.gz', 'sources.zip'])
     
+    def test_download_release_assets_concurrently(self):
+        """Test that assets of a release download in parallel and results keep asset order."""
+        release_data = {
+            'repository': 'test/repo',
+            'tag_name': 'v1.0.0',
+            'assets': [
+                {'name': f'asset{i}.tar.gz', 'browser_download_url': f'https://example.com/asset{i}.tar.gz'}
+                for i in range(3)
+            ]
+        }
+
+        # Every download waits for the other two, which only succeeds if all three run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def download_single_asset(asset, release_dir, release_data):
+            barrier.wait()
+            return {'asset_name': asset['name'], 'success': True}
+
+        with patch.object(self.downloader, '_download_single_asset', side_effect=download_single_asset):
+            results = self.downloader.download_release_assets(release_data)
+
+        self.assertEqual([r['asset_name'] for r in results],
+                         ['asset0.tar.gz', 'asset1.tar.gz', 'asset2.tar.gz'])
+        self.assertTrue(all(r['success'] for r in results))
+
     def test_download_release_assets_no_assets(self):
         """Test handling release with no assets."""
         release_data = {
@@ -179,6 +179,24 @@ class TestGitHubMonitor(unittest.TestCase):
         mock_sleep.assert_any_call(self.monitor.rate_limit_delay)
         mock_sleep.assert_any_call(160)  # (1100 - 1000) + 60
 
+    @patch('time.sleep')
+    def test_get_latest_release_not_modified(self, mock_sleep):
+        """Test conditional request with a stored ETag short-circuits on 304"""
+        mock_response = Mock()
+        mock_response.status_code = 304
+
+        self.monitor.session.get = Mock(return_value=mock_response)
+        self.monitor.etags['owner/repo'] = '"abc123"'
+
+        result = self.monitor.get_latest_release('owner', 'repo')
+
+        self.assertIsNone(result)
+        mock_response.json.assert_not_called()
+        self.monitor.session.get.assert_called_once_with(
+            'https://api.github.com/repos/owner/repo/releases/latest',
+            headers={'If-None-Match': '"abc123"'}
+        )
+
     @patch('time.sleep')
     def test_get_all_releases_success(self, mock_sleep):
         """Test successful fetch of all releases"""
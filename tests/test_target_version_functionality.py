@@ -21,6 +21,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from download_releases import ReleaseDownloadCoordinator
 from github_version_db import VersionDatabase
 
+# Blank Artifactory settings so the coordinator never auto-detects Artifactory storage
+ARTIFACTORY_DISABLED_ENV = {
+    'ARTIFACTORY_URL': '',
+    'ARTIFACTORY_REPOSITORY': '',
+    'ARTIFACTORY_API_KEY': '',
+    'ARTIFACTORY_USERNAME': '',
+    'ARTIFACTORY_PASSWORD': ''
+}
+
 
 class TestTargetVersionFunctionality(unittest.TestCase):
     """Comprehensive tests for target_version functionality."""
@@ -29,16 +38,6 @@ class TestTargetVersionFunctionality(unittest.TestCase):
         """Set up test environment with mocks and fixtures."""
         self.test_dir = tempfile.mkdtemp()
 
-        # Mock environment variables to prevent Artifactory usage during tests
-        self.env_patcher = patch.dict(os.environ, {
-            'ARTIFACTORY_URL': '',
-            'ARTIFACTORY_REPOSITORY': '',
-            'ARTIFACTORY_API_KEY': '',
-            'ARTIFACTORY_USERNAME': '',
-            'ARTIFACTORY_PASSWORD': ''
-        }, clear=False)
-        self.env_patcher.start()
-
         # Create test configuration with target_version repository overrides
         self.config = {
             'download': {
@@ -63,14 +62,15 @@ class TestTargetVersionFunctionality(unittest.TestCase):
             }
         }
 
-        # Initialize coordinator with mocked components
-        with patch('download_releases.GitHubDownloader') as mock_downloader_class:
+        # Initialize coordinator with mocked components; the environment is only read
+        # while the coordinator is built, so mock it there to prevent Artifactory usage
+        with patch.dict(os.environ, ARTIFACTORY_DISABLED_ENV), \
+             patch('download_releases.GitHubDownloader') as mock_downloader_class:
             self.coordinator = ReleaseDownloadCoordinator(self.config, 'fake_token', force_local=True)
             self.mock_downloader = mock_downloader_class.return_value
 
     def tearDown(self):
         """Clean up test environment."""
-        self.env_patcher.stop()
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
 
@@ -38,6 +38,14 @@ class TestVersionComparator(unittest.TestCase):
                     if key != 'type':
                         self.assertEqual(parsed[key], value)
     
+    def test_parse_version_returns_independent_copies(self):
+        """Test that cached parse results cannot be changed through a returned dict."""
+        parsed = self.comparator.parse_version('v1.2.3')
+        parsed['major'] = 99
+
+        self.assertEqual(self.comparator.parse_version('v1.2.3')['major'], 1)
+        self.assertEqual(self.comparator.compare('v1.2.3', 'v2.0.0'), -1)
+    
     def test_calver_parsing(self):
         """Test CalVer parsing."""
         test_cases = [
@@ -10,10 +10,12 @@ import json
 from datetime import datetime, timezone
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import github_version_db
 from github_version_db import VersionDatabase
 
 
@@ -183,6 +185,71 @@ class TestVersionDatabase(unittest.TestCase):
         self.assertEqual(history[0]['version'], 'v1.54.0')  # Most recent
         self.assertEqual(history[-1]['version'], 'v1.5.0')  # 50th from the end
     
+    def test_reload_only_when_file_changes(self):
+        """Test lookups reuse the parsed database until another writer changes the file."""
+        self.db.update_version('test', 'repo', 'v1.0.0')
+        self.assertEqual(self.db.get_current_version('test', 'repo'), 'v1.0.0')
+
+        # Nothing changed on disk since the last lookup
+        self.assertFalse(self.db.reload())
+
+        # A second handle (e.g. another process) updates the same file
+        other_db = VersionDatabase(self.db_path)
+        other_db.update_version('test', 'repo', 'v2.0.0')
+
+        self.assertEqual(self.db.get_current_version('test', 'repo'), 'v2.0.0')
+        self.assertFalse(self.db.reload())
+
+    def test_own_writes_refresh_cached_lookups(self):
+        """Test a write is seen even when the file signature does not change."""
+        self.db.update_version('test', 'repo', 'v1.0.0')
+        self.assertEqual(self.db.get_current_version('test', 'repo'), 'v1.0.0')
+
+        # Coarse mtime granularity can leave the signature unchanged across writes
+        with patch.object(self.db, '_file_signature', return_value=(1, 1, 1)):
+            self.db.reload()
+            self.db.update_version('test', 'repo', 'v2.0.0')
+            self.assertEqual(self.db.get_current_version('test', 'repo'), 'v2.0.0')
+
+    def test_history_changes_do_not_reach_the_database(self):
+        """Test callers changing returned history entries don't alter later lookups."""
+        self.db.update_version('test', 'repo', 'v1.0.0', {'files': ['a.tar.gz']})
+
+        history = self.db.get_download_history('test', 'repo')
+        history[0]['version'] = 'changed'
+        history[0]['metadata']['files'].append('b.tar.gz')
+
+        history = self.db.get_download_history('test', 'repo')
+        self.assertEqual(history[0]['version'], 'v1.0.0')
+        self.assertEqual(history[0]['metadata']['files'], ['a.tar.gz'])
+
+    def test_stdlib_json_fallback(self):
+        """Test the database round-trips without orjson installed."""
+        self.db.update_version('test', 'repo', 'v1.0.0', {'note': 'café'})
+
+        with patch.object(github_version_db, 'ORJSON_AVAILABLE', False):
+            db = VersionDatabase(self.db_path)
+            self.assertEqual(db.get_current_version('test', 'repo'), 'v1.0.0')
+            db.update_version('test', 'repo', 'v2.0.0', {'note': 'café'})
+
+        history = self.db.get_download_history('test', 'repo')
+        self.assertEqual(history[0]['version'], 'v2.0.0')
+        self.assertEqual(history[1]['metadata']['note'], 'café')
+
+    def test_in_memory_database(self):
+        """Test ':memory:' databases keep their data without touching the filesystem."""
+        db = VersionDatabase(':memory:')
+        db.update_version('test', 'repo', 'v1.0.0', {'note': 'first'})
+        db.update_version('test', 'repo', 'v1.1.0')
+
+        self.assertFalse(os.path.exists(':memory:'))
+        self.assertEqual(db.get_current_version('test', 'repo'), 'v1.1.0')
+        self.assertEqual(db.get_download_history('test', 'repo')[1]['metadata'], {'note': 'first'})
+        self.assertEqual(db.get_database_stats()['total_downloads'], 2)
+
+        # Every in-memory database starts empty
+        self.assertEqual(VersionDatabase(':memory:').get_all_repositories(), [])
+
     def test_concurrent_access_safety(self):
         """Test that file locking prevents corruption during concurrent access."""
         import threading
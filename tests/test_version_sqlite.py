@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SQLite Version Database
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import threading
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from download_releases import ReleaseDownloadCoordinator
+from github_version_db import VersionDatabase
+from github_version_sqlite import SQLiteVersionDatabase
+
+
+class TestSQLiteVersionDatabase(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test environment with temporary database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test_version_db.sqlite')
+        self.db = SQLiteVersionDatabase(self.db_path)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_database_initialization(self):
+        """Test database is created in WAL mode with metadata."""
+        self.assertTrue(os.path.exists(self.db_path))
+        self.assertEqual(self.db._fetch('PRAGMA journal_mode')[0][0], 'wal')
+
+        stats = self.db.get_database_stats()
+        self.assertEqual(stats['total_repositories'], 0)
+        self.assertEqual(stats['database_version'], '1.0')
+        self.assertIsNotNone(stats['database_created'])
+
+    def test_update_and_get_version(self):
+        """Test updating and retrieving version."""
+        self.assertIsNone(self.db.get_current_version('kubernetes', 'kubernetes'))
+
+        self.db.update_version('kubernetes', 'kubernetes', 'v1.28.0', {'file_size': 123456})
+
+        self.assertEqual(self.db.get_current_version('kubernetes', 'kubernetes'), 'v1.28.0')
+
+    def test_version_history(self):
+        """Test history is newest first and tracks previous versions."""
+        self.db.update_version('test', 'repo', 'v1.0.0')
+        self.db.update_version('test', 'repo', 'v1.1.0', {'note': 'café'})
+        self.db.update_version('test', 'repo', 'v1.2.0')
+
+        history = self.db.get_download_history('test', 'repo')
+
+        self.assertEqual([h['version'] for h in history], ['v1.2.0', 'v1.1.0', 'v1.0.0'])
+        self.assertEqual([h['previous_version'] for h in history], ['v1.1.0', 'v1.0.0', None])
+        self.assertEqual(history[1]['metadata'], {'note': 'café'})
+        self.assertEqual(len(self.db.get_download_history('test', 'repo', limit=2)), 2)
+
+    def test_history_limit_enforcement(self):
+        """Test that history is limited to the 50 most recent entries."""
+        for i in range(55):
+            self.db.update_version('test', 'repo', f'v1.{i}.0')
+
+        history = self.db.get_download_history('test', 'repo', limit=100)
+
+        self.assertEqual(len(history), 50)
+        self.assertEqual(history[0]['version'], 'v1.54.0')
+        self.assertEqual(history[-1]['version'], 'v1.5.0')
+
+    def test_get_all_repositories_and_stats(self):
+        """Test repository summaries and database statistics."""
+        self.db.update_version('kubernetes', 'kubernetes', 'v1.28.0')
+        self.db.update_version('kubernetes', 'kubernetes', 'v1.29.0')
+        self.db.update_version('hashicorp', 'terraform', 'v1.5.0')
+
+        repos = self.db.get_all_repositories()
+        self.assertEqual(len(repos), 2)
+        k8s_repo = next(r for r in repos if r['repo'] == 'kubernetes')
+        self.assertEqual(k8s_repo['owner'], 'kubernetes')
+        self.assertEqual(k8s_repo['current_version'], 'v1.29.0')
+        self.assertEqual(k8s_repo['download_count'], 2)
+
+        stats = self.db.get_database_stats()
+        self.assertEqual(stats['total_repositories'], 2)
+        self.assertEqual(stats['total_downloads'], 3)
+        self.assertIsNotNone(stats['last_updated'])
+        self.assertGreater(stats['database_size_bytes'], 0)
+
+    def test_remove_repository(self):
+        """Test repository removal drops its history too."""
+        self.db.update_version('test', 'repo', 'v1.0.0')
+
+        self.assertTrue(self.db.remove_repository('test', 'repo'))
+        self.assertIsNone(self.db.get_current_version('test', 'repo'))
+        self.assertEqual(self.db.get_download_history('test', 'repo'), [])
+        self.assertFalse(self.db.remove_repository('nonexistent', 'repo'))
+
+    def test_failed_update_rolls_back(self):
+        """Test that an update failing part way leaves no partial rows behind."""
+        with patch('github_version_sqlite.json.dumps', side_effect=TypeError('not serializable')):
+            with self.assertRaises(TypeError):
+                self.db.update_version('test', 'repo', 'v1.0.0', {'bad': object()})
+
+        self.assertIsNone(self.db.get_current_version('test', 'repo'))
+        self.db.update_version('test', 'repo', 'v1.0.0')
+        self.assertEqual(self.db.get_current_version('test', 'repo'), 'v1.0.0')
+
+    def test_persistence_across_connections(self):
+        """Test a second handle on the same file sees committed updates."""
+        self.db.update_version('test', 'repo', 'v1.0.0')
+
+        other_db = SQLiteVersionDatabase(self.db_path)
+        try:
+            self.assertEqual(other_db.get_current_version('test', 'repo'), 'v1.0.0')
+            other_db.update_version('test', 'repo', 'v2.0.0')
+        finally:
+            other_db.close()
+
+        self.assertEqual(self.db.get_current_version('test', 'repo'), 'v2.0.0')
+
+    def test_concurrent_updates_from_threads(self):
+        """Test threads sharing one database never lose or interleave updates."""
+        def update_versions(thread_id):
+            for i in range(5):
+                self.db.update_version(f'thread{thread_id}', 'repo', f'v{i}.0.0')
+
+        threads = [threading.Thread(target=update_versions, args=(i,)) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        for i in range(3):
+            self.assertEqual(self.db.get_current_version(f'thread{i}', 'repo'), 'v4.0.0')
+            self.assertEqual(len(self.db.get_download_history(f'thread{i}', 'repo')), 5)
+
+    def test_in_memory_database(self):
+        """Test ':memory:' databases work without touching the filesystem."""
+        db = SQLiteVersionDatabase(':memory:')
+        db.update_version('test', 'repo', 'v1.0.0')
+
+        self.assertFalse(os.path.exists(':memory:'))
+        self.assertEqual(db.get_current_version('test', 'repo'), 'v1.0.0')
+        self.assertEqual(db.get_database_stats()['database_size_bytes'], 0)
+
+    def test_coordinator_selects_backend_by_extension(self):
+        """Test the download coordinator uses SQLite only for SQLite file names."""
+        for file_name, backend in [('versions.sqlite', SQLiteVersionDatabase),
+                                   ('versions.DB', SQLiteVersionDatabase),
+                                   ('versions.json', VersionDatabase)]:
+            with self.subTest(file_name=file_name):
+                config = {'download': {'version_db': os.path.join(self.temp_dir, file_name)}}
+                with patch.dict(os.environ, {}, clear=True), patch('download_releases.GitHubDownloader'):
+                    coordinator = ReleaseDownloadCoordinator(config)
+                self.assertIsInstance(coordinator.version_db, backend)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ Handles intelligent comparison of version strings supporting various formats:
 
 import re
 import logging
+import functools
 from typing import Optional, Tuple, List, Union
 from datetime import datetime
 
@@ -69,9 +70,9 @@ class VersionComparator:
                 return 0
             return -1 if not version1 else 1
 
-        # Try to parse as different version types
-        v1_parsed = self.parse_version(version1)
-        v2_parsed = self.parse_version(version2)
+        # Try to parse as different version types (cached, read-only results)
+        v1_parsed = _parse_version(version1)
+        v2_parsed = _parse_version(version2)
 
         # If both versions are the same type, compare appropriately
         if v1_parsed['type'] == v2_parsed['type'] and v1_parsed['type'] != 'unknown':
@@ -134,6 +135,12 @@ class VersionComparator:
         Returns:
             Dictionary with parsed version components and type
         """
+        # Parsing is pure, so each distinct tag is parsed once per process; callers get a copy
+        return dict(_parse_version(version_string))
+
+    @classmethod
+    def _parse_version_uncached(cls, version_string: str) -> dict:
+        """Parse version string into components (see parse_version)."""
         if not version_string:
             return {'type': 'unknown', 'original': version_string}
 
@@ -141,7 +148,7 @@ class VersionComparator:
         clean_version = version_string.strip()
 
         # Try CalVer first by checking if it looks like a date-based version
-        calver_match = self.CALVER_PATTERN.match(clean_version)
+        calver_match = cls.CALVER_PATTERN.match(clean_version)
         if calver_match:
             year_str = calver_match.group('year')
             year = int(year_str)
@@ -167,7 +174,7 @@ class VersionComparator:
                 }
 
         # Try SemVer
-        semver_match = self.SEMVER_PATTERN.match(clean_version)
+        semver_match = cls.SEMVER_PATTERN.match(clean_version)
         if semver_match:
             return {
                 'type': 'semver',
@@ -181,7 +188,7 @@ class VersionComparator:
 
 
         # Try simple numeric versioning
-        numeric_match = self.SIMPLE_NUMERIC_PATTERN.match(clean_version)
+        numeric_match = cls.SIMPLE_NUMERIC_PATTERN.match(clean_version)
         if numeric_match:
             return {
                 'type': 'numeric',
@@ -198,7 +205,7 @@ class VersionComparator:
         return {
             'type': 'unknown',
             'original': version_string,
-            'normalized': self._normalize_string_version(clean_version)
+            'normalized': cls._normalize_string_version(clean_version)
         }
 
     def _compare_parsed_versions(self, v1: dict, v2: dict) -> int:
@@ -330,7 +337,8 @@ class VersionComparator:
 
         return 0
 
-    def _normalize_string_version(self, version: str) -> str:
+    @staticmethod
+    def _normalize_string_version(version: str) -> str:
         """Normalize version string for comparison."""
         # Remove common prefixes and clean up
         normalized = re.sub(r'^v(?=\d)', '', version.lower())
@@ -367,3 +375,9 @@ class VersionComparator:
             'parsed': parsed,
             'normalized': parsed.get('normalized', version)
         }
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version_string: str) -> dict:
+    """Parse a version string once per distinct string; treat the result as read-only."""
+    return VersionComparator._parse_version_uncached(version_string)